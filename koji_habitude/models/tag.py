@@ -966,7 +966,11 @@ def _simplified_link(data: Any) -> Any:
                 priority += priority_increment
 
             elif isinstance(item, dict):
-                priority = item.setdefault('priority', priority)
+                # copy rather than setdefault, so that the caller's data
+                # is left untouched
+                if 'priority' not in item:
+                    item = {**item, 'priority': priority}
+                priority = item['priority']
                 priorities.add(priority)
 
                 priority = max(priorities)
@@ -1096,7 +1100,7 @@ class Tag(TagModel, CoreObject):
                     if 'name' not in item:
                         raise ValueError(f"Group {item} must have a 'name' key")
                     if 'packages' not in item:
-                        item['packages'] = []
+                        item = {**item, 'packages': []}
 
                 if item['name'] in fixed:
                     raise ValueError(f"Duplicate group: {item['name']}")
@@ -1112,9 +1116,10 @@ class Tag(TagModel, CoreObject):
                     item = {'name': name, 'packages': item}
 
                 elif isinstance(item, dict):
-                    oldname = item.setdefault('name', name)
+                    oldname = item.get('name', name)
                     if oldname != name:
                         raise ValueError(f"Group name mismatch: {oldname} != {name}")
+                    item = {**item, 'name': name}
 
                 fixed[name] = item
 
@@ -71,12 +71,7 @@ class TestArchiveTypeModel(unittest.TestCase):
         archive_type = ArchiveType.from_dict(data)
 
         # Should strip leading dots from .jar and .war
-        self.assertIn('jar', archive_type.extensions)
-        self.assertIn('war', archive_type.extensions)
-        self.assertIn('ear', archive_type.extensions)
-        # Should not have any extensions with leading dots
-        for ext in archive_type.extensions:
-            self.assertFalse(ext.startswith('.'))
+        self.assertCountEqual(archive_type.extensions, ['jar', 'war', 'ear'])
 
     def test_archive_type_extensions_deduplicate(self):
         """
@@ -91,9 +86,7 @@ class TestArchiveTypeModel(unittest.TestCase):
         archive_type = ArchiveType.from_dict(data)
 
         # Should deduplicate to unique values
-        self.assertEqual(len(archive_type.extensions), 2)
-        self.assertIn('jar', archive_type.extensions)
-        self.assertIn('war', archive_type.extensions)
+        self.assertCountEqual(archive_type.extensions, ['jar', 'war'])
 
     def test_archive_type_extensions_strip_and_deduplicate(self):
         """
@@ -108,9 +101,7 @@ class TestArchiveTypeModel(unittest.TestCase):
         archive_type = ArchiveType.from_dict(data)
 
         # .jar and jar should become the same after stripping
-        self.assertEqual(len(archive_type.extensions), 2)
-        self.assertIn('jar', archive_type.extensions)
-        self.assertIn('war', archive_type.extensions)
+        self.assertCountEqual(archive_type.extensions, ['jar', 'war'])
 
     def test_archive_type_compression_type_tar(self):
         """
@@ -211,11 +202,8 @@ class TestArchiveTypeModel(unittest.TestCase):
         }
         archive_type = ArchiveType.from_dict(data)
 
-        self.assertEqual(len(archive_type.extensions), 4)
-        self.assertIn('tar.gz', archive_type.extensions)
-        self.assertIn('tgz', archive_type.extensions)
-        self.assertIn('tar.bz2', archive_type.extensions)
-        self.assertIn('tbz2', archive_type.extensions)
+        self.assertCountEqual(archive_type.extensions,
+                              ['tar.gz', 'tgz', 'tar.bz2', 'tbz2'])
 
     def test_archive_type_dependency_keys(self):
         """
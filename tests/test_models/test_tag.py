@@ -8,11 +8,98 @@ License: GNU General Public License v3
 AI-Assistant: Claude 3.5 Sonnet via Cursor
 """
 
+import copy
 import unittest
 
 from koji_habitude.models import Tag
 
 
+# Inputs shared across tests. Tag.from_dict does not modify the mapping
+# it is given (see test_tag_from_dict_leaves_data_unchanged), so tests
+# extend these with {**BASE_TAG_DATA, ...} rather than copying them.
+BASE_TAG_DATA = {'type': 'tag', 'name': 'test-tag'}
+
+FULL_TAG_DATA = {
+    **BASE_TAG_DATA,
+    'arches': ['x86_64', 'i686'],
+    'maven-support': True,
+    'maven-include-all': True,
+    'extras': {'key1': 'value1', 'key2': 'value2'},
+    'groups': {'group1': ['pkg1', 'pkg2']},
+    'inheritance': [
+        {'name': 'parent1', 'priority': 10},
+        {'name': 'parent2', 'priority': 20}
+    ],
+    'external-repos': [
+        {'name': 'repo1', 'priority': 30},
+        {'name': 'repo2', 'priority': 40}
+    ]
+}
+
+# Field values of a Tag created from BASE_TAG_DATA alone
+TAG_DEFAULTS = {
+    'arches': [],
+    'maven_support': False,
+    'maven_include_all': False,
+    'extras': {},
+    'groups': {},
+    'inheritance': [],
+    'external_repos': [],
+    'packages': [],
+}
+
+# Only the inheritance and external-repos entries of FULL_TAG_DATA
+# produce dependencies
+FULL_TAG_DEPS = [
+    ('tag', 'parent1'),
+    ('tag', 'parent2'),
+    ('external-repo', 'repo1'),
+    ('external-repo', 'repo2')
+]
+
+# case name: (data, expected dependency keys) for tags with no
+# dependencies, with inheritance and external repos, with package owners
+# (packages without an owner add nothing), and with all of these combined
+DEPENDENCY_CASES = {
+    'none': (BASE_TAG_DATA, []),
+    'links': (FULL_TAG_DATA, FULL_TAG_DEPS),
+    'owners': (
+        {**BASE_TAG_DATA,
+         'packages': [
+             {'name': 'package1', 'owner': 'user1'},
+             {'name': 'package2', 'owner': 'user2'},
+             {'name': 'package3'}  # No owner
+         ]},
+        [('user', 'user1'),
+         ('user', 'user2')]),
+    'combined': (
+        {**BASE_TAG_DATA,
+         'packages': [
+             {'name': 'package1', 'owner': 'user1'},
+             {'name': 'package2', 'owner': 'user2'}
+         ],
+         'inheritance': [
+             {'name': 'parent1', 'priority': 10}
+         ],
+         'external-repos': [
+             {'name': 'repo1', 'priority': 30}
+         ]},
+        [('tag', 'parent1'),
+         ('external-repo', 'repo1'),
+         ('user', 'user1'),
+         ('user', 'user2')]),
+}
+
+
+def group_packages(group):
+    """
+    The (name, type, block) of each package entry in a tag group, for
+    comparing a whole group in one assertion
+    """
+
+    return [(pkg.name, pkg.type, pkg.block) for pkg in group.packages]
+
+
 class TestTagModelCore(unittest.TestCase):
     """
     Test core Tag model functionality - creation, defaults, and splitting.
@@ -23,18 +110,12 @@ class TestTagModelCore(unittest.TestCase):
         Test Tag creation with default values.
         """
 
-        data = {'type': 'tag', 'name': 'test-tag'}
-        tag = Tag.from_dict(data)
+        tag = Tag.from_dict(BASE_TAG_DATA)
 
         self.assertEqual(tag.typename, 'tag')
         self.assertEqual(tag.name, 'test-tag')
-        self.assertEqual(tag.arches, [])
-        self.assertFalse(tag.maven_support)
-        self.assertFalse(tag.maven_include_all)
-        self.assertEqual(tag.extras, {})
-        self.assertEqual(tag.groups, {})
-        self.assertEqual(tag.inheritance, [])
-        self.assertEqual(tag.external_repos, [])
+        self.assertEqual({field: getattr(tag, field) for field in TAG_DEFAULTS},
+                         TAG_DEFAULTS)
         self.assertTrue(tag.can_split())
 
     def test_tag_creation_with_all_fields(self):
@@ -42,24 +123,7 @@ class TestTagModelCore(unittest.TestCase):
         Test Tag creation with all fields specified.
         """
 
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'arches': ['x86_64', 'i686'],
-            'maven-support': True,
-            'maven-include-all': True,
-            'extras': {'key1': 'value1', 'key2': 'value2'},
-            'groups': {'group1': ['pkg1', 'pkg2']},
-            'inheritance': [
-                {'name': 'parent1', 'priority': 10},
-                {'name': 'parent2', 'priority': 20}
-            ],
-            'external-repos': [
-                {'name': 'repo1', 'priority': 30},
-                {'name': 'repo2', 'priority': 40}
-            ]
-        }
-        tag = Tag.from_dict(data)
+        tag = Tag.from_dict(FULL_TAG_DATA)
 
         self.assertEqual(tag.arches, ['x86_64', 'i686'])
         self.assertTrue(tag.maven_support)
@@ -67,31 +131,67 @@ class TestTagModelCore(unittest.TestCase):
         self.assertEqual(tag.extras, {'key1': 'value1', 'key2': 'value2'})
 
         # Check groups structure (now TagGroup objects instead of simple lists)
-        self.assertEqual(len(tag.groups), 1)
-        self.assertIn('group1', tag.groups)
+        self.assertEqual(list(tag.groups), ['group1'])
         group1 = tag.groups['group1']
         self.assertEqual(group1.name, 'group1')
-        self.assertEqual(len(group1.packages), 2)
-        self.assertEqual(group1.packages[0].name, 'pkg1')
-        self.assertEqual(group1.packages[0].type, 'package')
-        self.assertEqual(group1.packages[0].block, False)
-        self.assertEqual(group1.packages[1].name, 'pkg2')
-        self.assertEqual(group1.packages[1].type, 'package')
-        self.assertEqual(group1.packages[1].block, False)
+        self.assertEqual(group_packages(group1),
+                         [('pkg1', 'package', False),
+                          ('pkg2', 'package', False)])
 
         # Check inheritance links (now separate field)
-        self.assertEqual(len(tag.inheritance), 2)
-        self.assertEqual(tag.inheritance[0].name, 'parent1')
-        self.assertEqual(tag.inheritance[0].priority, 10)
-        self.assertEqual(tag.inheritance[1].name, 'parent2')
-        self.assertEqual(tag.inheritance[1].priority, 20)
+        self.assertEqual([(parent.name, parent.priority) for parent in tag.inheritance],
+                         [('parent1', 10), ('parent2', 20)])
 
         # Check external repo links (now separate field)
-        self.assertEqual(len(tag.external_repos), 2)
-        self.assertEqual(tag.external_repos[0].name, 'repo1')
-        self.assertEqual(tag.external_repos[0].priority, 30)
-        self.assertEqual(tag.external_repos[1].name, 'repo2')
-        self.assertEqual(tag.external_repos[1].priority, 40)
+        self.assertEqual([(repo.name, repo.priority) for repo in tag.external_repos],
+                         [('repo1', 30), ('repo2', 40)])
+
+    def test_tag_from_dict_leaves_data_unchanged(self):
+        """
+        Test that converting the simplified inheritance, external-repos,
+        and groups formats fills in missing keys without modifying the
+        caller's data, so the same data converts identically each time.
+        """
+
+        cases = {
+            'links': {
+                **BASE_TAG_DATA,
+                'inheritance': ['parent1', {'name': 'parent2'}],
+                'external-repos': [{'name': 'repo1'}, 'repo2'],
+                'groups': {'build': {'packages': ['package1']}},
+            },
+            'group-list': {
+                **BASE_TAG_DATA,
+                'groups': [{'name': 'build'}, 'srpm'],
+            },
+        }
+
+        for case, data in cases.items():
+            with self.subTest(case=case):
+                original = copy.deepcopy(data)
+
+                first = Tag.from_dict(data)
+                self.assertEqual(data, original)
+
+                second = Tag.from_dict(data)
+                self.assertEqual(second.to_dict(), first.to_dict())
+
+    def test_tag_list_fields_empty_or_missing(self):
+        """
+        Test that the inheritance, external-repos, and packages fields
+        are empty lists whether given as an empty list or left out.
+        """
+
+        fields = (('inheritance', 'inheritance'),
+                  ('external-repos', 'external_repos'),
+                  ('packages', 'packages'))
+
+        for field, attr in fields:
+            for case, data in (('empty', {**BASE_TAG_DATA, field: []}),
+                               ('missing', BASE_TAG_DATA)):
+                with self.subTest(field=field, case=case):
+                    tag = Tag.from_dict(data)
+                    self.assertEqual(getattr(tag, attr), [])
 
     def test_tag_split(self):
         """
@@ -99,8 +199,7 @@ class TestTagModelCore(unittest.TestCase):
         """
 
         data = {
-            'type': 'tag',
-            'name': 'test-tag',
+            **BASE_TAG_DATA,
             'arches': ['x86_64'],
             'maven-support': True,
             'inheritance': [
@@ -114,92 +213,48 @@ class TestTagModelCore(unittest.TestCase):
 
         split_tag = tag.split()
         self.assertIsInstance(split_tag, Tag)
-        self.assertEqual(split_tag.name, 'test-tag')
-        self.assertEqual(split_tag.arches, ['x86_64'])
         # Inheritance and external repos should not be included in split (dependency data)
-        self.assertEqual(split_tag.inheritance, [])
-        self.assertEqual(split_tag.external_repos, [])
+        self.assertEqual((split_tag.name, split_tag.arches,
+                          split_tag.inheritance, split_tag.external_repos),
+                         ('test-tag', ['x86_64'], [], []))
 
 
-class TestTagModelInheritanceField(unittest.TestCase):
+class TestTagModelLinkPriorities(unittest.TestCase):
     """
-    Test Tag model inheritance field validation and simplified format conversion.
+    Test the priority numbering shared by the inheritance and
+    external-repos simplified formats.
     """
 
-    def test_tag_inheritance_simple_string_list(self):
-        """
-        Test Tag creation with inheritance as a simple list of strings.
-        Strings should be converted to tag inheritance with incrementing priorities.
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'inheritance': ['parent1', 'parent2', 'parent3']
-        }
-        tag = Tag.from_dict(data)
-
-        # Check that inheritance was converted to full objects
-        self.assertEqual(len(tag.inheritance), 3)
-
-        # Check first parent (priority 0)
-        self.assertEqual(tag.inheritance[0].name, 'parent1')
-        self.assertEqual(tag.inheritance[0].priority, 0)
-
-        # Check second parent (priority 10)
-        self.assertEqual(tag.inheritance[1].name, 'parent2')
-        self.assertEqual(tag.inheritance[1].priority, 10)
-
-        # Check third parent (priority 20)
-        self.assertEqual(tag.inheritance[2].name, 'parent3')
-        self.assertEqual(tag.inheritance[2].priority, 20)
-
-    def test_tag_inheritance_mixed_string_and_dict_list(self):
+    def test_tag_link_string_and_dict_lists(self):
         """
-        Test Tag creation with inheritance mixing strings and dict objects.
-        Strings should be converted to tag inheritance, dicts should be used as-is.
+        Test Tag creation with inheritance or external-repos as a list
+        of strings, or as a mix of strings and dicts. Strings should be
+        given priorities incrementing by 10 from the highest priority
+        seen so far, dicts should be used as-is.
         """
 
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'inheritance': [
-                'parent1',  # String - should become tag with priority 0
-                {'name': 'parent2', 'priority': 50},  # Dict with explicit priority
-                'parent3',  # String - should become tag with priority 10
-            ]
+        cases = {
+            'strings': (['link1', 'link2', 'link3'],
+                        [('link1', 0), ('link2', 10), ('link3', 20)]),
+            'mixed': (['link1',
+                       {'name': 'link2', 'priority': 50},
+                       'link3'],
+                      [('link1', 0), ('link2', 50), ('link3', 60)]),
         }
-        tag = Tag.from_dict(data)
-
-        # Check that inheritance was processed correctly
-        self.assertEqual(len(tag.inheritance), 3)
 
-        # Check string conversion (parent1)
-        self.assertEqual(tag.inheritance[0].name, 'parent1')
-        self.assertEqual(tag.inheritance[0].priority, 0)
+        for field, attr in (('inheritance', 'inheritance'),
+                            ('external-repos', 'external_repos')):
+            for case, (links, expected) in cases.items():
+                with self.subTest(field=field, case=case):
+                    data = {
+                        **BASE_TAG_DATA,
+                        field: links,
+                    }
+                    tag = Tag.from_dict(data)
 
-        # Check dict with explicit priority (parent2)
-        self.assertEqual(tag.inheritance[1].name, 'parent2')
-        self.assertEqual(tag.inheritance[1].priority, 50)
-
-        # Check string conversion (parent3) - priority should increment from max existing
-        self.assertEqual(tag.inheritance[2].name, 'parent3')
-        self.assertEqual(tag.inheritance[2].priority, 60)  # 50 + 10
-
-    def test_tag_inheritance_empty_list(self):
-        """
-        Test Tag creation with empty inheritance list.
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'inheritance': []
-        }
-        tag = Tag.from_dict(data)
-
-        # Check that inheritance is empty
-        self.assertEqual(len(tag.inheritance), 0)
+                    found = [(link.name, link.priority)
+                             for link in getattr(tag, attr)]
+                    self.assertEqual(found, expected)
 
 
 class TestTagModelExternalReposField(unittest.TestCase):
@@ -207,82 +262,26 @@ class TestTagModelExternalReposField(unittest.TestCase):
     Test Tag model external-repos field validation and simplified format conversion.
     """
 
-    def test_tag_external_repos_simple_string_list(self):
-        """
-        Test Tag creation with external-repos as a simple list of strings.
-        Strings should be converted to external repo links with incrementing priorities.
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'external-repos': ['repo1', 'repo2', 'repo3']
-        }
-        tag = Tag.from_dict(data)
-
-        # Check that external repos were converted to full objects
-        self.assertEqual(len(tag.external_repos), 3)
-
-        # Check first repo (priority 0)
-        self.assertEqual(tag.external_repos[0].name, 'repo1')
-        self.assertEqual(tag.external_repos[0].priority, 0)
-
-        # Check second repo (priority 10)
-        self.assertEqual(tag.external_repos[1].name, 'repo2')
-        self.assertEqual(tag.external_repos[1].priority, 10)
-
-        # Check third repo (priority 20)
-        self.assertEqual(tag.external_repos[2].name, 'repo3')
-        self.assertEqual(tag.external_repos[2].priority, 20)
-
-    def test_tag_external_repos_mixed_string_and_dict_list(self):
+    def test_tag_external_repos_merge_mode(self):
         """
-        Test Tag creation with external-repos mixing strings and dict objects.
-        Strings should be converted to external repo links, dicts should be used as-is.
+        Test that external-repos given as strings get the default
+        'koji' merge mode, while dicts keep their own.
         """
 
         data = {
-            'type': 'tag',
-            'name': 'test-tag',
+            **BASE_TAG_DATA,
             'external-repos': [
-                'repo1',  # String - should become repo with priority 0
-                {'name': 'repo2', 'priority': 50, 'merge-mode': 'simple'},  # Dict with explicit priority
-                'repo3',  # String - should become repo with priority 10
-            ]
-        }
-        tag = Tag.from_dict(data)
-
-        # Check that external repos were processed correctly
-        self.assertEqual(len(tag.external_repos), 3)
-
-        # Check string conversion (repo1)
-        self.assertEqual(tag.external_repos[0].name, 'repo1')
-        self.assertEqual(tag.external_repos[0].priority, 0)
-        self.assertEqual(tag.external_repos[0].merge_mode, 'koji')  # default
-
-        # Check dict with explicit priority (repo2)
-        self.assertEqual(tag.external_repos[1].name, 'repo2')
-        self.assertEqual(tag.external_repos[1].priority, 50)
-        self.assertEqual(tag.external_repos[1].merge_mode, 'simple')
-
-        # Check string conversion (repo3) - priority should increment from max existing
-        self.assertEqual(tag.external_repos[2].name, 'repo3')
-        self.assertEqual(tag.external_repos[2].priority, 60)  # 50 + 10
-
-    def test_tag_external_repos_empty_list(self):
-        """
-        Test Tag creation with empty external-repos list.
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'external-repos': []
+                'repo1',
+                {'name': 'repo2', 'priority': 50, 'merge-mode': 'simple'},
+                'repo3',
+            ],
         }
         tag = Tag.from_dict(data)
 
-        # Check that external repos is empty
-        self.assertEqual(len(tag.external_repos), 0)
+        found = [(repo.name, repo.merge_mode) for repo in tag.external_repos]
+        self.assertEqual(found, [('repo1', 'koji'),
+                                 ('repo2', 'simple'),
+                                 ('repo3', 'koji')])
 
     def test_tag_external_repos_with_arches(self):
         """
@@ -290,8 +289,7 @@ class TestTagModelExternalReposField(unittest.TestCase):
         """
 
         data = {
-            'type': 'tag',
-            'name': 'test-tag',
+            **BASE_TAG_DATA,
             'external-repos': [
                 {'name': 'repo1', 'priority': 10, 'arches': ['x86_64', 'i686']},
                 {'name': 'repo2', 'priority': 20, 'merge-mode': 'simple'}
@@ -299,17 +297,12 @@ class TestTagModelExternalReposField(unittest.TestCase):
         }
         tag = Tag.from_dict(data)
 
-        # Check first repo with arches
-        self.assertEqual(tag.external_repos[0].name, 'repo1')
-        self.assertEqual(tag.external_repos[0].priority, 10)
-        self.assertEqual(tag.external_repos[0].arches, ['x86_64', 'i686'])
-        self.assertEqual(tag.external_repos[0].merge_mode, 'koji')  # default
-
-        # Check second repo with merge mode
-        self.assertEqual(tag.external_repos[1].name, 'repo2')
-        self.assertEqual(tag.external_repos[1].priority, 20)
-        self.assertEqual(tag.external_repos[1].arches, None)  # default
-        self.assertEqual(tag.external_repos[1].merge_mode, 'simple')
+        # repo1 specifies arches and gets the default merge mode, repo2
+        # specifies a merge mode and gets the default arches
+        found = [(repo.name, repo.priority, repo.arches, repo.merge_mode)
+                 for repo in tag.external_repos]
+        self.assertEqual(found, [('repo1', 10, ['x86_64', 'i686'], 'koji'),
+                                 ('repo2', 20, None, 'simple')])
 
 
 class TestTagModelGroupsField(unittest.TestCase):
@@ -317,74 +310,37 @@ class TestTagModelGroupsField(unittest.TestCase):
     Test Tag model groups field validation, formats, and error handling.
     """
 
-    def test_tag_groups_dict_format(self):
-        """
-        Test Tag creation with groups in dict format: {'group_name': ['pkg1', 'pkg2']}
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'groups': {'build': ['package1', 'package2'], 'srpm': ['source1']}
-        }
-        tag = Tag.from_dict(data)
-
-        # Check groups structure
-        self.assertEqual(len(tag.groups), 2)
-
-        # Check build group
-        self.assertIn('build', tag.groups)
-        build_group = tag.groups['build']
-        self.assertEqual(build_group.name, 'build')
-        self.assertEqual(len(build_group.packages), 2)
-        self.assertEqual(build_group.packages[0].name, 'package1')
-        self.assertEqual(build_group.packages[0].type, 'package')
-        self.assertEqual(build_group.packages[0].block, False)
-        self.assertEqual(build_group.packages[1].name, 'package2')
-        self.assertEqual(build_group.packages[1].type, 'package')
-        self.assertEqual(build_group.packages[1].block, False)
-
-        # Check srpm group
-        self.assertIn('srpm', tag.groups)
-        srpm_group = tag.groups['srpm']
-        self.assertEqual(srpm_group.name, 'srpm')
-        self.assertEqual(len(srpm_group.packages), 1)
-        self.assertEqual(srpm_group.packages[0].name, 'source1')
-        self.assertEqual(srpm_group.packages[0].type, 'package')
-        self.assertEqual(srpm_group.packages[0].block, False)
-
-    def test_tag_groups_list_format(self):
+    def test_tag_groups_dict_and_list_format(self):
         """
-        Test Tag creation with groups in list format: [{'name': 'group', 'packages': ['pkg']}]
+        Test Tag creation with groups in dict format
+        {'group_name': ['pkg1', 'pkg2']} and in list format
+        [{'name': 'group', 'packages': ['pkg']}]. Both should produce
+        the same groups.
         """
 
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'groups': [
+        formats = {
+            'dict': {'build': ['package1', 'package2'], 'srpm': ['source1']},
+            'list': [
                 {'name': 'build', 'packages': ['package1', 'package2']},
                 {'name': 'srpm', 'packages': ['source1']}
-            ]
+            ],
         }
-        tag = Tag.from_dict(data)
-
-        # Check groups structure
-        self.assertEqual(len(tag.groups), 2)
 
-        # Check build group
-        self.assertIn('build', tag.groups)
-        build_group = tag.groups['build']
-        self.assertEqual(build_group.name, 'build')
-        self.assertEqual(len(build_group.packages), 2)
-        self.assertEqual(build_group.packages[0].name, 'package1')
-        self.assertEqual(build_group.packages[1].name, 'package2')
+        for fmt, groups in formats.items():
+            with self.subTest(format=fmt):
+                data = {
+                    **BASE_TAG_DATA,
+                    'groups': groups,
+                }
+                tag = Tag.from_dict(data)
 
-        # Check srpm group
-        self.assertIn('srpm', tag.groups)
-        srpm_group = tag.groups['srpm']
-        self.assertEqual(srpm_group.name, 'srpm')
-        self.assertEqual(len(srpm_group.packages), 1)
-        self.assertEqual(srpm_group.packages[0].name, 'source1')
+                found = {name: (group.name, group_packages(group))
+                         for name, group in tag.groups.items()}
+                self.assertEqual(found, {
+                    'build': ('build', [('package1', 'package', False),
+                                        ('package2', 'package', False)]),
+                    'srpm': ('srpm', [('source1', 'package', False)]),
+                })
 
     def test_tag_groups_dict_with_package_objects(self):
         """
@@ -392,8 +348,7 @@ class TestTagModelGroupsField(unittest.TestCase):
         """
 
         data = {
-            'type': 'tag',
-            'name': 'test-tag',
+            **BASE_TAG_DATA,
             'groups': {
                 'build': {
                     'packages': [
@@ -406,28 +361,15 @@ class TestTagModelGroupsField(unittest.TestCase):
         }
         tag = Tag.from_dict(data)
 
-        # Check groups structure
-        self.assertEqual(len(tag.groups), 1)
-
-        # Check build group
+        self.assertEqual(list(tag.groups), ['build'])
         build_group = tag.groups['build']
         self.assertEqual(build_group.name, 'build')
-        self.assertEqual(len(build_group.packages), 3)
-
-        # First package (simple string)
-        self.assertEqual(build_group.packages[0].name, 'package1')
-        self.assertEqual(build_group.packages[0].type, 'package')
-        self.assertEqual(build_group.packages[0].block, False)
 
-        # Second package (explicit dict)
-        self.assertEqual(build_group.packages[1].name, 'package2')
-        self.assertEqual(build_group.packages[1].type, 'package')
-        self.assertEqual(build_group.packages[1].block, False)
-
-        # Third package (group with @ prefix - name should keep the @ when specified explicitly)
-        self.assertEqual(build_group.packages[2].name, '@group1')
-        self.assertEqual(build_group.packages[2].type, 'group')
-        self.assertEqual(build_group.packages[2].block, True)
+        # The explicit group entry keeps its @ prefix
+        self.assertEqual(group_packages(build_group),
+                         [('package1', 'package', False),
+                          ('package2', 'package', False),
+                          ('@group1', 'group', True)])
 
     def test_tag_groups_string_package_with_at_prefix(self):
         """
@@ -435,90 +377,47 @@ class TestTagModelGroupsField(unittest.TestCase):
         """
 
         data = {
-            'type': 'tag',
-            'name': 'test-tag',
+            **BASE_TAG_DATA,
             'groups': {
                 'build': ['package1', '@group1', 'package2', '@group2']
             }
         }
         tag = Tag.from_dict(data)
 
-        # Check groups structure
-        build_group = tag.groups['build']
-        self.assertEqual(len(build_group.packages), 4)
-
-        # First package (no @ prefix)
-        self.assertEqual(build_group.packages[0].name, 'package1')
-        self.assertEqual(build_group.packages[0].type, 'package')
-        self.assertEqual(build_group.packages[0].block, False)
-
-        # Second package (@ prefix)
-        self.assertEqual(build_group.packages[1].name, '@group1')
-        self.assertEqual(build_group.packages[1].type, 'group')
-        self.assertEqual(build_group.packages[1].block, False)
-
-        # Third package (no @ prefix)
-        self.assertEqual(build_group.packages[2].name, 'package2')
-        self.assertEqual(build_group.packages[2].type, 'package')
-        self.assertEqual(build_group.packages[2].block, False)
-
-        # Fourth package (@ prefix)
-        self.assertEqual(build_group.packages[3].name, '@group2')
-        self.assertEqual(build_group.packages[3].type, 'group')
-        self.assertEqual(build_group.packages[3].block, False)
-
-    def test_tag_groups_duplicate_group_names_error(self):
-        """
-        Test that duplicate group names in list format raise an error.
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'groups': [
-                {'name': 'build', 'packages': ['package1']},
-                {'name': 'build', 'packages': ['package2']}  # Duplicate name
-            ]
-        }
-
-        with self.assertRaises(ValueError) as context:
-            Tag.from_dict(data)
-
-        self.assertIn('Duplicate group: build', str(context.exception))
-
-    def test_tag_groups_invalid_string_in_dict_error(self):
-        """
-        Test that string values in dict format raise an error.
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'groups': {
-                'build': 'package1'  # String instead of list/dict
-            }
+        # Strings with an @ prefix are group entries
+        self.assertEqual(group_packages(tag.groups['build']),
+                         [('package1', 'package', False),
+                          ('@group1', 'group', False),
+                          ('package2', 'package', False),
+                          ('@group2', 'group', False)])
+
+    def test_tag_groups_invalid_data_errors(self):
+        """
+        Test that malformed groups data raises an error: duplicate
+        group names or a missing name in list format, a string value or
+        a mismatched name in dict format, and a groups value that is
+        neither a dict nor a list.
+        """
+
+        cases = {
+            'duplicate': ([{'name': 'build', 'packages': ['package1']},
+                           {'name': 'build', 'packages': ['package2']}],
+                          'Duplicate group: build'),
+            'string-group': ({'build': 'package1'},
+                             'Group build must be a dictionary or list'),
+            'string-groups': ('invalid',
+                              'Groups must be a dictionary or list'),
+            'name-mismatch': ({'build': {'name': 'other', 'packages': []}},
+                              'Group name mismatch'),
+            'missing-name': ([{'packages': []}],
+                             "must have a 'name' key"),
         }
 
-        with self.assertRaises(ValueError) as context:
-            Tag.from_dict(data)
-
-        self.assertIn('Group build must be a dictionary or list', str(context.exception))
-
-    def test_tag_groups_invalid_data_type_error(self):
-        """
-        Test that invalid data types for groups raise an error.
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'groups': 'invalid'  # String instead of dict/list
-        }
-
-        with self.assertRaises(ValueError) as context:
-            Tag.from_dict(data)
-
-        self.assertIn('Groups must be a dictionary or list', str(context.exception))
+        for case, (groups, message) in cases.items():
+            with self.subTest(case=case):
+                data = {**BASE_TAG_DATA, 'groups': groups}
+                with self.assertRaisesRegex(ValueError, message):
+                    Tag.from_dict(data)
 
 
 class TestTagModelPackagesField(unittest.TestCase):
@@ -526,47 +425,13 @@ class TestTagModelPackagesField(unittest.TestCase):
     Test Tag model packages field validation and simplified format conversion.
     """
 
-    def test_tag_packages_simple_string_list(self):
-        """
-        Test Tag creation with packages as a simple list of strings.
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'packages': ['package1', 'package2', 'package3']
-        }
-        tag = Tag.from_dict(data)
-
-        # Check that packages were converted to PackageEntry objects
-        self.assertEqual(len(tag.packages), 3)
-
-        # Check first package
-        self.assertEqual(tag.packages[0].name, 'package1')
-        self.assertEqual(tag.packages[0].block, False)
-        self.assertEqual(tag.packages[0].owner, None)
-        self.assertEqual(tag.packages[0].extra_arches, [])
-
-        # Check second package
-        self.assertEqual(tag.packages[1].name, 'package2')
-        self.assertEqual(tag.packages[1].block, False)
-        self.assertEqual(tag.packages[1].owner, None)
-        self.assertEqual(tag.packages[1].extra_arches, [])
-
-        # Check third package
-        self.assertEqual(tag.packages[2].name, 'package3')
-        self.assertEqual(tag.packages[2].block, False)
-        self.assertEqual(tag.packages[2].owner, None)
-        self.assertEqual(tag.packages[2].extra_arches, [])
-
     def test_tag_packages_dict_format(self):
         """
         Test Tag creation with packages in dict format with full specifications.
         """
 
         data = {
-            'type': 'tag',
-            'name': 'test-tag',
+            **BASE_TAG_DATA,
             'packages': [
                 {'name': 'package1', 'owner': 'user1'},
                 {'name': 'package2', 'owner': 'user2', 'blocked': True},
@@ -575,96 +440,45 @@ class TestTagModelPackagesField(unittest.TestCase):
         }
         tag = Tag.from_dict(data)
 
-        # Check packages structure
-        self.assertEqual(len(tag.packages), 3)
-
-        # Check first package (with owner)
-        self.assertEqual(tag.packages[0].name, 'package1')
-        self.assertEqual(tag.packages[0].owner, 'user1')
-        self.assertEqual(tag.packages[0].block, False)
-        self.assertEqual(tag.packages[0].extra_arches, [])
-
-        # Check second package (with owner and blocked)
-        self.assertEqual(tag.packages[1].name, 'package2')
-        self.assertEqual(tag.packages[1].owner, 'user2')
-        self.assertEqual(tag.packages[1].block, True)
-        self.assertEqual(tag.packages[1].extra_arches, [])
-
-        # Check third package (with owner and extra-arches)
-        self.assertEqual(tag.packages[2].name, 'package3')
-        self.assertEqual(tag.packages[2].owner, 'user3')
-        self.assertEqual(tag.packages[2].block, False)
-        self.assertEqual(tag.packages[2].extra_arches, ['i686', 'ppc64le'])
-
-    def test_tag_packages_mixed_format(self):
-        """
-        Test Tag creation with packages mixing strings and dict objects.
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'packages': [
-                'package1',  # Simple string
-                {'name': 'package2', 'owner': 'user2'},  # Dict with owner
-                'package3',  # Simple string
-                {'name': 'package4', 'owner': 'user4', 'blocked': True}  # Dict with owner and blocked
-            ]
+        found = [(pkg.name, pkg.owner, pkg.block, pkg.extra_arches)
+                 for pkg in tag.packages]
+        self.assertEqual(found, [('package1', 'user1', False, []),
+                                 ('package2', 'user2', True, []),
+                                 ('package3', 'user3', False, ['i686', 'ppc64le'])])
+
+    def test_tag_packages_string_and_dict_lists(self):
+        """
+        Test Tag creation with packages as a list of strings, or as a mix
+        of strings and dicts. Strings should be converted to unblocked
+        PackageEntry objects with no owner and no extra arches.
+        """
+
+        cases = {
+            'strings': (['package1', 'package2', 'package3'],
+                        [('package1', None, False, []),
+                         ('package2', None, False, []),
+                         ('package3', None, False, [])]),
+            'mixed': (['package1',
+                       {'name': 'package2', 'owner': 'user2'},
+                       'package3',
+                       {'name': 'package4', 'owner': 'user4', 'blocked': True}],
+                      [('package1', None, False, []),
+                       ('package2', 'user2', False, []),
+                       ('package3', None, False, []),
+                       ('package4', 'user4', True, [])]),
         }
-        tag = Tag.from_dict(data)
-
-        # Check that packages were processed correctly
-        self.assertEqual(len(tag.packages), 4)
-
-        # Check string conversion (package1)
-        self.assertEqual(tag.packages[0].name, 'package1')
-        self.assertEqual(tag.packages[0].owner, None)
-        self.assertEqual(tag.packages[0].block, False)
-
-        # Check dict with owner (package2)
-        self.assertEqual(tag.packages[1].name, 'package2')
-        self.assertEqual(tag.packages[1].owner, 'user2')
-        self.assertEqual(tag.packages[1].block, False)
-
-        # Check string conversion (package3)
-        self.assertEqual(tag.packages[2].name, 'package3')
-        self.assertEqual(tag.packages[2].owner, None)
-        self.assertEqual(tag.packages[2].block, False)
-
-        # Check dict with owner and blocked (package4)
-        self.assertEqual(tag.packages[3].name, 'package4')
-        self.assertEqual(tag.packages[3].owner, 'user4')
-        self.assertEqual(tag.packages[3].block, True)
-
-    def test_tag_packages_empty_list(self):
-        """
-        Test Tag creation with empty packages list.
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'packages': []
-        }
-        tag = Tag.from_dict(data)
 
-        # Check that packages is empty
-        self.assertEqual(len(tag.packages), 0)
-
-    def test_tag_packages_default_empty(self):
-        """
-        Test that packages defaults to empty list when not specified.
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag'
-        }
-        tag = Tag.from_dict(data)
+        for case, (packages, expected) in cases.items():
+            with self.subTest(case=case):
+                data = {
+                    **BASE_TAG_DATA,
+                    'packages': packages,
+                }
+                tag = Tag.from_dict(data)
 
-        # Check that packages defaults to empty
-        self.assertEqual(len(tag.packages), 0)
-        self.assertEqual(tag.packages, [])
+                found = [(pkg.name, pkg.owner, pkg.block, pkg.extra_arches)
+                         for pkg in tag.packages]
+                self.assertEqual(found, expected)
 
     def test_tag_packages_with_extra_arches(self):
         """
@@ -672,8 +486,7 @@ class TestTagModelPackagesField(unittest.TestCase):
         """
 
         data = {
-            'type': 'tag',
-            'name': 'test-tag',
+            **BASE_TAG_DATA,
             'packages': [
                 {'name': 'package1', 'owner': 'user1', 'extra-arches': ['x86_64', 'i686']},
                 {'name': 'package2', 'owner': 'user2', 'extra-arches': ['ppc64le']}
@@ -681,15 +494,10 @@ class TestTagModelPackagesField(unittest.TestCase):
         }
         tag = Tag.from_dict(data)
 
-        # Check first package with multiple arches
-        self.assertEqual(tag.packages[0].name, 'package1')
-        self.assertEqual(tag.packages[0].owner, 'user1')
-        self.assertEqual(tag.packages[0].extra_arches, ['x86_64', 'i686'])
-
-        # Check second package with single arch
-        self.assertEqual(tag.packages[1].name, 'package2')
-        self.assertEqual(tag.packages[1].owner, 'user2')
-        self.assertEqual(tag.packages[1].extra_arches, ['ppc64le'])
+        found = [(pkg.name, pkg.owner, pkg.extra_arches)
+                 for pkg in tag.packages]
+        self.assertEqual(found, [('package1', 'user1', ['x86_64', 'i686']),
+                                 ('package2', 'user2', ['ppc64le'])])
 
     def test_tag_packages_blocked_flag(self):
         """
@@ -697,8 +505,7 @@ class TestTagModelPackagesField(unittest.TestCase):
         """
 
         data = {
-            'type': 'tag',
-            'name': 'test-tag',
+            **BASE_TAG_DATA,
             'packages': [
                 {'name': 'package1', 'owner': 'user1', 'blocked': False},
                 {'name': 'package2', 'owner': 'user2', 'blocked': True},
@@ -707,17 +514,11 @@ class TestTagModelPackagesField(unittest.TestCase):
         }
         tag = Tag.from_dict(data)
 
-        # Check first package (explicitly not blocked)
-        self.assertEqual(tag.packages[0].name, 'package1')
-        self.assertEqual(tag.packages[0].block, False)
-
-        # Check second package (blocked)
-        self.assertEqual(tag.packages[1].name, 'package2')
-        self.assertEqual(tag.packages[1].block, True)
-
-        # Check third package (default not blocked)
-        self.assertEqual(tag.packages[2].name, 'package3')
-        self.assertEqual(tag.packages[2].block, False)
+        # package3 is not blocked by default
+        found = [(pkg.name, pkg.block) for pkg in tag.packages]
+        self.assertEqual(found, [('package1', False),
+                                 ('package2', True),
+                                 ('package3', False)])
 
 
 class TestTagModelDependencyResolution(unittest.TestCase):
@@ -727,95 +528,13 @@ class TestTagModelDependencyResolution(unittest.TestCase):
 
     def test_tag_dependency_keys(self):
         """
-        Test Tag dependency resolution.
+        Test Tag dependency resolution for each of DEPENDENCY_CASES.
         """
 
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'inheritance': [
-                {'name': 'parent1', 'priority': 10},
-                {'name': 'parent2', 'priority': 20}
-            ],
-            'external-repos': [
-                {'name': 'repo1', 'priority': 30},
-                {'name': 'repo2', 'priority': 40}
-            ]
-        }
-        tag = Tag.from_dict(data)
-
-        deps = tag.dependency_keys()
-        expected = [
-            ('tag', 'parent1'),
-            ('tag', 'parent2'),
-            ('external-repo', 'repo1'),
-            ('external-repo', 'repo2')
-        ]
-        self.assertEqual(deps, expected)
-
-    def test_tag_dependency_keys_empty(self):
-        """
-        Test Tag dependency resolution with no inheritance or external repos.
-        """
-
-        data = {'type': 'tag', 'name': 'test-tag'}
-        tag = Tag.from_dict(data)
-
-        deps = tag.dependency_keys()
-        self.assertEqual(deps, [])
-
-    def test_tag_dependency_keys_with_package_owners(self):
-        """
-        Test Tag dependency resolution includes package owners.
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'packages': [
-                {'name': 'package1', 'owner': 'user1'},
-                {'name': 'package2', 'owner': 'user2'},
-                {'name': 'package3'}  # No owner
-            ]
-        }
-        tag = Tag.from_dict(data)
-
-        deps = tag.dependency_keys()
-        expected = [
-            ('user', 'user1'),
-            ('user', 'user2')
-        ]
-        self.assertEqual(deps, expected)
-
-    def test_tag_dependency_keys_with_all_dependencies(self):
-        """
-        Test Tag dependency resolution with packages, inheritance, and external repos.
-        """
-
-        data = {
-            'type': 'tag',
-            'name': 'test-tag',
-            'packages': [
-                {'name': 'package1', 'owner': 'user1'},
-                {'name': 'package2', 'owner': 'user2'}
-            ],
-            'inheritance': [
-                {'name': 'parent1', 'priority': 10}
-            ],
-            'external-repos': [
-                {'name': 'repo1', 'priority': 30}
-            ]
-        }
-        tag = Tag.from_dict(data)
-
-        deps = tag.dependency_keys()
-        expected = [
-            ('tag', 'parent1'),
-            ('external-repo', 'repo1'),
-            ('user', 'user1'),
-            ('user', 'user2')
-        ]
-        self.assertEqual(deps, expected)
+        for case, (data, expected) in DEPENDENCY_CASES.items():
+            with self.subTest(case=case):
+                tag = Tag.from_dict(data)
+                self.assertEqual(tag.dependency_keys(), expected)
 
 
 class TestTagModelSorting(unittest.TestCase):
@@ -830,8 +549,7 @@ class TestTagModelSorting(unittest.TestCase):
 
         # Create tag with unsorted data in all sorted fields
         data = {
-            'type': 'tag',
-            'name': 'test-tag',
+            **BASE_TAG_DATA,
             'arches': ['i686', 'x86_64', 'aarch64', 'ppc64le'],  # Unsorted
             'packages': [
                 {'name': 'package-z', 'owner': 'user1'},
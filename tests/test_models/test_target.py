@@ -13,22 +13,36 @@ import unittest
 from koji_habitude.models import Target
 
 
+# Dependencies of a target with both build-tag and dest-tag given
+BOTH_TAGS_DEPS = [('tag', 'build-tag'), ('tag', 'dest-tag')]
+
+
 class TestTargetModel(unittest.TestCase):
     """
     Test the Target model.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        # None of these tests modify their target, so each is built once
+        cls.build_target = Target.from_dict({
+            'type': 'target',
+            'name': 'test-target',
+            'build-tag': 'build-tag'
+        })
+        cls.both_target = Target.from_dict({
+            'type': 'target',
+            'name': 'test-target',
+            'build-tag': 'build-tag',
+            'dest-tag': 'dest-tag'
+        })
+
     def test_target_creation_with_build_tag(self):
         """
         Test Target creation with build-tag specified.
         """
 
-        data = {
-            'type': 'target',
-            'name': 'test-target',
-            'build-tag': 'build-tag'
-        }
-        target = Target.from_dict(data)
+        target = self.build_target
 
         self.assertEqual(target.typename, 'target')
         self.assertEqual(target.name, 'test-target')
@@ -41,13 +55,7 @@ class TestTargetModel(unittest.TestCase):
         Test Target creation with both build-tag and dest-tag specified.
         """
 
-        data = {
-            'type': 'target',
-            'name': 'test-target',
-            'build-tag': 'build-tag',
-            'dest-tag': 'dest-tag'
-        }
-        target = Target.from_dict(data)
+        target = self.both_target
 
         self.assertEqual(target.build_tag, 'build-tag')
         self.assertEqual(target.dest_tag, 'dest-tag')
@@ -57,32 +65,16 @@ class TestTargetModel(unittest.TestCase):
         Test that model_post_init sets dest_tag to name when not specified.
         """
 
-        data = {
-            'type': 'target',
-            'name': 'test-target',
-            'build-tag': 'build-tag'
-            # dest-tag not specified
-        }
-        target = Target.from_dict(data)
-
-        self.assertEqual(target.dest_tag, None)
+        # build_target does not specify dest-tag
+        self.assertEqual(self.build_target.dest_tag, None)
 
     def test_target_dependency_keys(self):
         """
         Test Target dependency resolution.
         """
 
-        data = {
-            'type': 'target',
-            'name': 'test-target',
-            'build-tag': 'build-tag',
-            'dest-tag': 'dest-tag'
-        }
-        target = Target.from_dict(data)
-
-        deps = target.dependency_keys()
-        expected = [('tag', 'build-tag'), ('tag', 'dest-tag')]
-        self.assertEqual(deps, expected)
+        deps = self.both_target.dependency_keys()
+        self.assertEqual(deps, BOTH_TAGS_DEPS)
 
 
 # The end.
@@ -13,11 +13,34 @@ import unittest
 from koji_habitude.models import User
 
 
+# A user with every field given. Tests that only read the resulting
+# User share the instance built in TestUserModel.setUpClass
+FULL_USER_DATA = {
+    'type': 'user',
+    'name': 'test-user',
+    'groups': ['group1', 'group2'],
+    'permissions': ['admin', 'build'],
+    'enabled': False
+}
+
+# The groups and permissions of FULL_USER_DATA are its dependencies
+FULL_USER_DEPS = [
+    ('group', 'group1'),
+    ('group', 'group2'),
+    ('permission', 'admin'),
+    ('permission', 'build')
+]
+
+
 class TestUserModel(unittest.TestCase):
     """
     Test the User model.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        cls.full_user = User.from_dict(FULL_USER_DATA)
+
     def test_user_creation_with_defaults(self):
         """
         Test User creation with default values.
@@ -38,14 +61,7 @@ class TestUserModel(unittest.TestCase):
         Test User creation with all fields specified.
         """
 
-        data = {
-            'type': 'user',
-            'name': 'test-user',
-            'groups': ['group1', 'group2'],
-            'permissions': ['admin', 'build'],
-            'enabled': False
-        }
-        user = User.from_dict(data)
+        user = self.full_user
 
         self.assertEqual(user.groups, ['group1', 'group2'])
         self.assertEqual(user.permissions, ['admin', 'build'])
@@ -56,14 +72,8 @@ class TestUserModel(unittest.TestCase):
         Test User splitting functionality.
         """
 
-        data = {
-            'type': 'user',
-            'name': 'test-user',
-            'groups': ['group1', 'group2'],
-            'permissions': ['admin', 'build'],
-            'enabled': False
-        }
-        user = User.from_dict(data)
+        # split marks the original as split, so use a fresh user
+        user = User.from_dict(FULL_USER_DATA)
         split_user = user.split()
         self.assertIsInstance(split_user, User)
         self.assertEqual(split_user.name, 'test-user')
@@ -73,36 +83,18 @@ class TestUserModel(unittest.TestCase):
 
     def test_user_dependency_keys(self):
         """
-        Test User dependency resolution.
+        Test User dependency resolution, with and without groups and
+        permissions.
         """
 
-        data = {
-            'type': 'user',
-            'name': 'test-user',
-            'groups': ['group1', 'group2'],
-            'permissions': ['admin', 'build']
+        cases = {
+            'full': (self.full_user, FULL_USER_DEPS),
+            'empty': (User.from_dict({'type': 'user', 'name': 'test-user'}), []),
         }
-        user = User.from_dict(data)
-
-        deps = user.dependency_keys()
-        expected = [
-            ('group', 'group1'),
-            ('group', 'group2'),
-            ('permission', 'admin'),
-            ('permission', 'build')
-        ]
-        self.assertEqual(deps, expected)
-
-    def test_user_dependency_keys_empty(self):
-        """
-        Test User dependency resolution with no groups or permissions.
-        """
-
-        data = {'type': 'user', 'name': 'test-user'}
-        user = User.from_dict(data)
 
-        deps = user.dependency_keys()
-        self.assertEqual(deps, [])
+        for case, (user, expected) in cases.items():
+            with self.subTest(case=case):
+                self.assertEqual(user.dependency_keys(), expected)
 
 
 class TestUserModelSorting(unittest.TestCase):
@@ -12,8 +12,8 @@ AI-Assistant: Claude 3.5 Sonnet via Cursor
 
 import logging
 import unittest
-from unittest.mock import Mock, patch
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 from koji_habitude.namespace import (
     add_into, Redefine, RedefineError, Namespace
@@ -23,19 +23,29 @@ from koji_habitude.models import Tag, ExternalRepo, User, Target, Host, Group
 import yaml
 
 
+# Object data shared by the namespace tests. Each test still creates
+# its own objects from these.
+TAG_DATA = {'type': 'tag', 'name': 'test-tag'}
+TEMPLATE_DATA = {'type': 'template', 'name': 'test-template', 'content': 'test'}
+CALL_DATA = {'type': 'custom-template', 'name': 'test-call'}
+
+
 class MockObject:
     """Mock object for testing add_into function."""
 
+    __slots__ = ('name', 'filename', 'lineno', '_filepos_str')
+
     def __init__(self, name, filename="test.yaml", lineno=1):
         self.name = name
         self.filename = filename
         self.lineno = lineno
+        self._filepos_str = f"{filename}:{lineno}"
 
     def filepos(self):
         return (self.filename, self.lineno)
 
     def filepos_str(self):
-        return f"{self.filename}:{self.lineno}"
+        return self._filepos_str
 
     def __eq__(self, other):
         return isinstance(other, MockObject) and self.name == other.name
@@ -44,13 +54,18 @@ class MockObject:
 class TestAddInto(unittest.TestCase):
     """Test cases for the add_into helper function."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up the mock objects, which add_into never modifies."""
+
+        cls.mock_obj1 = MockObject("test1", "file1.yaml", 10)
+        cls.mock_obj2 = MockObject("test2", "file2.yaml", 20)
+        cls.mock_obj1_duplicate = MockObject("test1", "file3.yaml", 30)
+
     def setUp(self):
-        """Set up test fixtures."""
+        """Set up a fresh dictionary for each test."""
 
         self.test_dict = {}
-        self.mock_obj1 = MockObject("test1", "file1.yaml", 10)
-        self.mock_obj2 = MockObject("test2", "file2.yaml", 20)
-        self.mock_obj1_duplicate = MockObject("test1", "file3.yaml", 30)
 
     def test_add_into_empty_dict(self):
         """Test adding to an empty dictionary."""
@@ -85,19 +100,20 @@ class TestAddInto(unittest.TestCase):
     def test_add_into_redefine_error_default(self):
         """Test that redefinition raises error by default."""
 
-        add_into(self.test_dict, "key1", self.mock_obj1)
+        self.test_dict["key1"] = self.mock_obj1
 
         with self.assertRaises(RedefineError) as context:
             add_into(self.test_dict, "key1", self.mock_obj1_duplicate)
 
-        self.assertIn("Redefinition of 'key1'", str(context.exception))
-        self.assertIn("file1.yaml:10", str(context.exception))
-        self.assertIn("file3.yaml:30", str(context.exception))
+        message = str(context.exception)
+        self.assertIn("Redefinition of 'key1'", message)
+        self.assertIn("file1.yaml:10", message)
+        self.assertIn("file3.yaml:30", message)
 
     def test_add_into_redefine_error_explicit(self):
         """Test explicit ERROR redefine behavior."""
 
-        add_into(self.test_dict, "key1", self.mock_obj1)
+        self.test_dict["key1"] = self.mock_obj1
 
         with self.assertRaises(RedefineError):
             add_into(self.test_dict, "key1", self.mock_obj1_duplicate,
@@ -106,61 +122,39 @@ class TestAddInto(unittest.TestCase):
         # Original object should still be there
         self.assertIs(self.test_dict["key1"], self.mock_obj1)
 
-    def test_add_into_redefine_ignore(self):
-        """Test IGNORE redefine behavior."""
-
-        add_into(self.test_dict, "key1", self.mock_obj1)
-
-        # Should not raise error and should keep original
-        add_into(self.test_dict, "key1", self.mock_obj1_duplicate,
-                redefine=Redefine.IGNORE)
-
-        self.assertIs(self.test_dict["key1"], self.mock_obj1)
-
-    def test_add_into_redefine_allow(self):
-        """Test ALLOW redefine behavior."""
-
-        add_into(self.test_dict, "key1", self.mock_obj1)
-
-        # Should replace with new object
-        add_into(self.test_dict, "key1", self.mock_obj1_duplicate,
-                redefine=Redefine.ALLOW)
-
-        self.assertIs(self.test_dict["key1"], self.mock_obj1_duplicate)
-
-    @patch('koji_habitude.namespace.default_logger')
-    def test_add_into_redefine_ignore_warn(self, mock_logger):
-        """Test IGNORE_WARN redefine behavior."""
-
-        add_into(self.test_dict, "key1", self.mock_obj1)
-
-        # Should warn but keep original
-        add_into(self.test_dict, "key1", self.mock_obj1_duplicate,
-                redefine=Redefine.IGNORE_WARN)
+    def test_add_into_redefine_modes(self):
+        """Test which object each non-error redefine mode keeps, and
+        which modes warn through the default logger."""
 
-        self.assertIs(self.test_dict["key1"], self.mock_obj1)
-        mock_logger.warning.assert_called_once()
-        self.assertIn("Ignored redefinition", mock_logger.warning.call_args[0][0])
+        # mode: (object expected to be kept, expected warning or None)
+        modes = {
+            Redefine.IGNORE: (self.mock_obj1, None),
+            Redefine.ALLOW: (self.mock_obj1_duplicate, None),
+            Redefine.IGNORE_WARN: (self.mock_obj1, "Ignored redefinition"),
+            Redefine.ALLOW_WARN: (self.mock_obj1_duplicate, "Redefined"),
+        }
 
-    @patch('koji_habitude.namespace.default_logger')
-    def test_add_into_redefine_allow_warn(self, mock_logger):
-        """Test ALLOW_WARN redefine behavior."""
+        for mode, (kept, warning) in modes.items():
+            with self.subTest(mode=mode), \
+                 patch('koji_habitude.namespace.default_logger',
+                       spec_set=True) as mock_logger:
 
-        add_into(self.test_dict, "key1", self.mock_obj1)
+                test_dict = {"key1": self.mock_obj1}
+                add_into(test_dict, "key1", self.mock_obj1_duplicate,
+                         redefine=mode)
 
-        # Should warn and replace with new object
-        add_into(self.test_dict, "key1", self.mock_obj1_duplicate,
-                redefine=Redefine.ALLOW_WARN)
-
-        self.assertIs(self.test_dict["key1"], self.mock_obj1_duplicate)
-        mock_logger.warning.assert_called_once()
-        self.assertIn("Redefined", mock_logger.warning.call_args[0][0])
+                self.assertIs(test_dict["key1"], kept)
+                if warning is None:
+                    mock_logger.warning.assert_not_called()
+                else:
+                    mock_logger.warning.assert_called_once()
+                    self.assertIn(warning, mock_logger.warning.call_args[0][0])
 
     def test_add_into_custom_logger(self):
         """Test using a custom logger."""
 
         custom_logger = Mock(spec=logging.Logger)
-        add_into(self.test_dict, "key1", self.mock_obj1)
+        self.test_dict["key1"] = self.mock_obj1
 
         add_into(self.test_dict, "key1", self.mock_obj1_duplicate,
                 redefine=Redefine.IGNORE_WARN, logger=custom_logger)
@@ -169,35 +163,30 @@ class TestAddInto(unittest.TestCase):
         self.assertIn("Ignored redefinition", custom_logger.warning.call_args[0][0])
 
     def test_add_into_various_key_types(self):
-        """Test add_into with various key types."""
+        """Test add_into with various key types, including None."""
 
-        # String key
-        add_into(self.test_dict, "string_key", self.mock_obj1)
+        keys = ["string_key", ("type", "name"), 42, None]
 
-        # Tuple key (like namespace uses)
-        add_into(self.test_dict, ("type", "name"), self.mock_obj2)
+        for key in keys:
+            with self.subTest(key=key):
+                test_dict = {}
+                add_into(test_dict, key, self.mock_obj1)
 
-        # Integer key
-        mock_obj3 = MockObject("test3")
-        add_into(self.test_dict, 42, mock_obj3)
-
-        self.assertEqual(len(self.test_dict), 3)
-        self.assertIs(self.test_dict["string_key"], self.mock_obj1)
-        self.assertIs(self.test_dict[("type", "name")], self.mock_obj2)
-        self.assertIs(self.test_dict[42], mock_obj3)
-
-    def test_add_into_none_key(self):
-        """Test add_into with None as key."""
-
-        add_into(self.test_dict, None, self.mock_obj1)
-
-        self.assertEqual(len(self.test_dict), 1)
-        self.assertIs(self.test_dict[None], self.mock_obj1)
+                self.assertEqual(len(test_dict), 1)
+                self.assertIs(test_dict[key], self.mock_obj1)
 
 
 class TestNamespaceInitAndGuards(unittest.TestCase):
     """Test cases for Namespace initialization and add/add_template method guards."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up the objects the guards reject, which are never added."""
+
+        cls.reject_template = Template.from_dict(TEMPLATE_DATA)
+        cls.reject_call = TemplateCall.from_dict(CALL_DATA)
+        cls.reject_tag = Tag.from_dict(TAG_DATA)
+
     def test_namespace_default_initialization(self):
         """Test creating a Namespace with default parameters."""
 
@@ -207,17 +196,12 @@ class TestNamespaceInitAndGuards(unittest.TestCase):
         self.assertEqual(ns.redefine, Redefine.ERROR)
         self.assertIsNotNone(ns.logger)
 
-        # Check typemap has core models
-        self.assertIn("tag", ns.typemap)
-        self.assertIn("external-repo", ns.typemap)
-        self.assertIn("user", ns.typemap)
-        self.assertIn("target", ns.typemap)
-        self.assertIn("host", ns.typemap)
-        self.assertIn("group", ns.typemap)
-
-        # Check templates are enabled by default
-        self.assertIn("template", ns.typemap)
-        self.assertIn(None, ns.typemap)  # TemplateCall fallback
+        # Check typemap has core models, and that templates are
+        # enabled by default (None is the TemplateCall fallback)
+        self.assertLessEqual(
+            {"tag", "external-repo", "user", "target", "host", "group",
+             "template", None},
+            ns.typemap.keys())
 
         # Check internal storage is initialized
         self.assertEqual(len(ns._feedline), 0)
@@ -243,15 +227,9 @@ class TestNamespaceInitAndGuards(unittest.TestCase):
         self.assertEqual(ns.redefine, Redefine.ALLOW)
         self.assertIs(ns.logger, custom_logger)
 
-        # Check only custom coretypes are in typemap
-        self.assertIn("tag", ns.typemap)
-        self.assertIn("external-repo", ns.typemap)
-        self.assertNotIn("user", ns.typemap)
-        self.assertNotIn("target", ns.typemap)
-
-        # Check templates are disabled
-        self.assertNotIn("template", ns.typemap)
-        self.assertNotIn(None, ns.typemap)
+        # Check only custom coretypes are in typemap, with templates
+        # disabled
+        self.assertEqual(set(ns.typemap), {"tag", "external-repo"})
 
     def test_namespace_templates_enabled(self):
         """Test that templates are properly configured when enabled."""
@@ -273,8 +251,7 @@ class TestNamespaceInitAndGuards(unittest.TestCase):
         """Test adding a valid core object to namespace."""
 
         ns = Namespace()
-        tag_data = {'type': 'tag', 'name': 'test-tag'}
-        tag_obj = Tag.from_dict(tag_data)
+        tag_obj = Tag.from_dict(TAG_DATA)
 
         # Should not raise any exception
         ns.add(tag_obj)
@@ -288,32 +265,23 @@ class TestNamespaceInitAndGuards(unittest.TestCase):
         """Test that add() rejects Template objects."""
 
         ns = Namespace()
-        template_data = {'type': 'template', 'name': 'test-template', 'content': 'test'}
-        template_obj = Template.from_dict(template_data)
-
-        with self.assertRaises(TypeError) as context:
-            ns.add(template_obj)
 
-        self.assertIn("Template cannot be directly added", str(context.exception))
+        with self.assertRaisesRegex(TypeError, "Template cannot be directly added"):
+            ns.add(self.reject_template)
 
-    def test_add_template_guard_rejects_template_call(self):
+    def test_add_guard_rejects_template_call(self):
         """Test that add() rejects TemplateCall objects."""
 
         ns = Namespace()
-        call_data = {'type': 'custom-template', 'name': 'test-call'}
-        call_obj = TemplateCall.from_dict(call_data)
 
-        with self.assertRaises(TypeError) as context:
-            ns.add(call_obj)
-
-        self.assertIn("TemplateCall cannot be directly added", str(context.exception))
+        with self.assertRaisesRegex(TypeError, "TemplateCall cannot be directly added"):
+            ns.add(self.reject_call)
 
     def test_add_template_valid_template(self):
         """Test adding a valid Template to namespace."""
 
         ns = Namespace()
-        template_data = {'type': 'template', 'name': 'test-template', 'content': 'test'}
-        template_obj = Template.from_dict(template_data)
+        template_obj = Template.from_dict(TEMPLATE_DATA)
 
         # Should not raise any exception
         ns.add_template(template_obj)
@@ -326,33 +294,24 @@ class TestNamespaceInitAndGuards(unittest.TestCase):
         """Test that add_template() rejects non-Template objects."""
 
         ns = Namespace()
-        tag_data = {'type': 'tag', 'name': 'test-tag'}
-        tag_obj = Tag.from_dict(tag_data)
-
-        with self.assertRaises(TypeError) as context:
-            ns.add_template(tag_obj)
 
-        self.assertIn("add_template requires a Template instance", str(context.exception))
+        with self.assertRaisesRegex(TypeError, "add_template requires a Template instance"):
+            ns.add_template(self.reject_tag)
 
     def test_add_template_guard_rejects_template_call(self):
         """Test that add_template() rejects TemplateCall objects."""
 
         ns = Namespace()
-        call_data = {'type': 'custom-template', 'name': 'test-call'}
-        call_obj = TemplateCall.from_dict(call_data)
-
-        with self.assertRaises(TypeError) as context:
-            ns.add_template(call_obj)
 
-        self.assertIn("add_template requires a Template instance", str(context.exception))
+        with self.assertRaisesRegex(TypeError, "add_template requires a Template instance"):
+            ns.add_template(self.reject_call)
 
     def test_add_duplicate_object_raises_error(self):
         """Test that adding duplicate objects raises RedefineError with ERROR mode."""
 
         ns = Namespace(redefine=Redefine.ERROR)
-        tag_data = {'type': 'tag', 'name': 'test-tag'}
-        tag_obj1 = Tag.from_dict(tag_data)
-        tag_obj2 = Tag.from_dict(tag_data)
+        tag_obj1 = Tag.from_dict(TAG_DATA)
+        tag_obj2 = Tag.from_dict(TAG_DATA)
 
         # First add should succeed
         ns.add(tag_obj1)
@@ -381,8 +340,7 @@ class TestNamespaceInitAndGuards(unittest.TestCase):
         """Test that adding the same object instance twice is allowed."""
 
         ns = Namespace(redefine=Redefine.ERROR)
-        tag_data = {'type': 'tag', 'name': 'test-tag'}
-        tag_obj = Tag.from_dict(tag_data)
+        tag_obj = Tag.from_dict(TAG_DATA)
 
         # Both adds should succeed (same instance)
         ns.add(tag_obj)
@@ -397,8 +355,7 @@ class TestNamespaceInitAndGuards(unittest.TestCase):
         """Test that adding the same template instance twice is allowed."""
 
         ns = Namespace(redefine=Redefine.ERROR)
-        template_data = {'type': 'template', 'name': 'test-template', 'content': 'test'}
-        template_obj = Template.from_dict(template_data)
+        template_obj = Template.from_dict(TEMPLATE_DATA)
 
         # Both adds should succeed (same instance)
         ns.add_template(template_obj)
@@ -412,17 +369,18 @@ class TestNamespaceInitAndGuards(unittest.TestCase):
 class TestNamespaceToObjectMethods(unittest.TestCase):
     """Test cases for Namespace to_object and to_objects methods."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the namespace, which to_object never modifies."""
 
-        self.ns = Namespace()
+        cls.ns = Namespace()
 
     def test_to_object_core_types(self):
         """Test to_object with all core koji object types."""
 
         # Test each core type
         test_cases = [
-            ({'type': 'tag', 'name': 'test-tag'}, Tag),
+            (TAG_DATA, Tag),
             ({'type': 'external-repo', 'name': 'test-repo', 'url': 'https://example.com/repo'}, ExternalRepo),
             ({'type': 'user', 'name': 'test-user'}, User),
             ({'type': 'target', 'name': 'test-target', 'build-tag': 'test-build-tag'}, Target),
@@ -494,14 +452,12 @@ class TestNamespaceToObjectMethods(unittest.TestCase):
         ns_no_templates = Namespace(enable_templates=False)
 
         # Core types should still work
-        tag_data = {'type': 'tag', 'name': 'test-tag'}
-        obj = ns_no_templates.to_object(tag_data)
+        obj = ns_no_templates.to_object(TAG_DATA)
         self.assertIsInstance(obj, Tag)
 
         # Template type should fail
-        template_data = {'type': 'template', 'name': 'test-template', 'content': 'test'}
         with self.assertRaises(ValueError) as context:
-            ns_no_templates.to_object(template_data)
+            ns_no_templates.to_object(TEMPLATE_DATA)
         self.assertIn("No type handler for template", str(context.exception))
 
         # Unknown types should also fail (no TemplateCall fallback)
@@ -517,8 +473,7 @@ class TestNamespaceToObjectMethods(unittest.TestCase):
         custom_ns = Namespace(coretypes=[Tag, User])
 
         # Supported types should work
-        tag_data = {'type': 'tag', 'name': 'test-tag'}
-        obj = custom_ns.to_object(tag_data)
+        obj = custom_ns.to_object(TAG_DATA)
         self.assertIsInstance(obj, Tag)
 
         user_data = {'type': 'user', 'name': 'test-user'}
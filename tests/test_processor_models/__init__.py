@@ -9,13 +9,12 @@ AI-Assistant: Claude 3.5 Sonnet via Cursor
 # Vibe-Coding State: AI Generated with Human Rework
 
 
-from unittest.mock import patch
-from typing import List, Tuple, Any, Dict
-
-from koji import ClientSession
-from unittest.mock import MagicMock, Mock, patch
+from collections import deque
+from typing import List, Tuple, Any, Deque, Dict, Iterable, Iterator, cast
+from unittest.mock import Mock, patch
 
 from koji_habitude.koji import session
+from koji_habitude.processor import Processor
 from koji_habitude.resolver import Resolver
 from koji_habitude.solver import Solver
 from koji_habitude.models import BaseObject, BaseKey
@@ -37,6 +36,21 @@ def create_test_koji_session():
     return sess
 
 
+class _StubSolver:
+    """
+    Stands in for a Solver as a Processor dataseries, which only ever
+    iterates over it.
+    """
+
+    __slots__ = ('objects',)
+
+    def __init__(self, objects: Iterable[BaseObject]):
+        self.objects = objects
+
+    def __iter__(self) -> Iterator[BaseObject]:
+        return iter(self.objects)
+
+
 def create_empty_solver() -> Solver:
     """
     Create a Solver with no objects for testing empty scenarios.
@@ -57,9 +71,7 @@ def create_solver_with_objects(objects: List[BaseObject]) -> Solver:
     Returns:
         Solver that yields the provided objects
     """
-    mock_solver = Mock(spec=Solver)
-    mock_solver.__iter__ = Mock(return_value=iter(objects))
-    return mock_solver
+    return cast(Solver, _StubSolver(objects))
 
 
 def create_empty_resolver() -> Resolver:
@@ -84,6 +96,34 @@ def create_resolver_with_objects(objects: Dict[BaseKey, BaseObject]) -> Resolver
     return mock_resolver
 
 
+def create_processor(
+        objects: List[BaseObject],
+        resolver: Resolver = None,
+        chunk_size: int = 10) -> Processor:
+    """
+    Create a Processor over specific objects for testing, using a test
+    koji session and a solver yielding those objects.
+
+    Args:
+        objects: List of BaseObject objects for the processor to work through
+        resolver: Resolver to use (default an empty resolver)
+        chunk_size: Number of objects processed per step (default 10)
+
+    Returns:
+        Processor ready to step or run
+    """
+
+    if resolver is None:
+        resolver = create_empty_resolver()
+
+    return Processor(
+        koji_session=create_test_koji_session(),
+        dataseries=create_solver_with_objects(objects),
+        resolver=resolver,
+        chunk_size=chunk_size
+    )
+
+
 class MulticallMocking:
     """
     Base test class for processor tests with koji mocking infrastructure.
@@ -93,6 +133,20 @@ class MulticallMocking:
     """
 
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up the session configuration mocks shared by the class."""
+        super().setUpClass()
+        cls.setup_config_mock()
+
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the session configuration mocks."""
+        cls.teardown_config_mock()
+        super().tearDownClass()
+
+
     def setUp(self):
         """Set up mocks for koji ClientSession and MultiCallSession _callMethod."""
         self.setup_session_mock()
@@ -103,10 +157,40 @@ class MulticallMocking:
         self.teardown_session_mock()
 
 
+    @classmethod
+    def setup_config_mock(cls):
+        """
+        Set up mocks for koji_cli.lib.activate_session and
+        koji.read_config.
+
+        These rarely need per-test customization, so they are patched
+        once for the whole class. setup_session_mock resets them before
+        each test.
+        """
+
+        # Mock for koji_cli.lib.activate_session
+        cls.activate_session_patcher = patch('koji_habitude.koji.activate_session')
+        cls.activate_session_mock = cls.activate_session_patcher.start()
+
+        # Mock for koji.read_config (used in koji_habitude.koji.session)
+        cls.read_config_patcher = patch('koji_habitude.koji.read_config')
+        cls.read_config_mock = cls.read_config_patcher.start()
+
+
+    @classmethod
+    def teardown_config_mock(cls):
+        """Clean up the session configuration mocks."""
+        if hasattr(cls, 'activate_session_patcher'):
+            cls.activate_session_patcher.stop()
+        if hasattr(cls, 'read_config_patcher'):
+            cls.read_config_patcher.stop()
+
+
     def setup_session_mock(self):
         """
-        Set up mocks for koji ClientSession._callMethod,
-        koji_cli.lib.activate_session, and koji.read_config.
+        Set up mocks for koji ClientSession._callMethod, and reset the
+        class-wide koji_cli.lib.activate_session and koji.read_config
+        mocks.
 
         This allows tests to control what koji API calls return by providing
         expected results for specific method calls.
@@ -116,13 +200,9 @@ class MulticallMocking:
         self.client_callmethod_patcher = patch('koji.ClientSession._callMethod')
         self.client_callmethod_mock = self.client_callmethod_patcher.start()
 
-        # Mock for koji_cli.lib.activate_session
-        self.activate_session_patcher = patch('koji_habitude.koji.activate_session')
-        self.activate_session_mock = self.activate_session_patcher.start()
-
-        # Mock for koji.read_config (used in koji_habitude.koji.session)
-        self.read_config_patcher = patch('koji_habitude.koji.read_config')
-        self.read_config_mock = self.read_config_patcher.start()
+        # Clear anything an earlier test in the class configured
+        self.activate_session_mock.reset_mock(return_value=True, side_effect=True)
+        self.read_config_mock.reset_mock(return_value=True, side_effect=True)
 
         # Additional koji mocks that may be needed:
         # - koji.ClientSession (for session creation)
@@ -136,7 +216,8 @@ class MulticallMocking:
         self.activate_session_mock.return_value = None
         self.read_config_mock.return_value = {}
 
-        self.client_responses = {}
+        # method name to a queue of its responses, consumed in order
+        self.client_responses: Dict[str, Deque[Any]] = {}
 
         self.configure_koji_responses(
             config_responses={
@@ -144,43 +225,46 @@ class MulticallMocking:
             }
         )
 
+        # bound once for the closure below. configure_koji_responses and
+        # queue_client_response add to this same dict, it is never rebound
+        responses = self.client_responses
+
+        def dispatch(method_name, args, kwargs):
+            # Answer a single call with the next response queued for it
+            queue = responses.get(method_name)
+            if not queue:
+                raise IndexError(f"No response queued for {method_name}")
+            resp = queue.popleft()
+            if callable(resp):
+                if args and isinstance(args[-1], dict) and "__starstar" in args[-1]:
+                    kwargs = args[-1]
+                    kwargs.pop("__starstar")
+                    args = args[:-1]
+                return resp(*args, **kwargs)
+            return resp
+
         def client_side_effect(method_name, *args, **kwargs):
             # Handle the actual multicall execution
             if method_name == 'multiCall':
-                # The multicall format is multiCall((calls,), {}) where calls is a list of call objects
+                # The multicall format is multiCall((calls,), {}) where calls
+                # is a list of call objects. Each call in the batch is
+                # dispatched in order.
                 calls = args[0][0] if args and args[0] else []
-                results = []
-
-                # Process each call in the multicall batch
-                for call in calls:
-                    call_method = call.get('methodName', '')
-                    call_params = call.get('params', ())
-                    results.append([client_side_effect(call_method, *call_params)])
-
-                return results
+                return [[dispatch(call.get('methodName', ''),
+                                  call.get('params', ()), {})]
+                        for call in calls]
 
             else:
-                resp = self.client_responses.get(method_name, []).pop(0)
-                if callable(resp):
-                    if args and isinstance(args[-1], dict) and "__starstar" in args[-1]:
-                        kwargs = args[-1]
-                        kwargs.pop("__starstar")
-                        args = args[:-1]
-                    return resp(*args, **kwargs)
-                return resp
+                return dispatch(method_name, args, kwargs)
 
 
         self.client_callmethod_mock.side_effect = client_side_effect
 
 
     def teardown_session_mock(self):
-        """Clean up the _callMethod mocks."""
+        """Clean up the _callMethod mock."""
         if hasattr(self, 'client_callmethod_patcher'):
             self.client_callmethod_patcher.stop()
-        if hasattr(self, 'activate_session_patcher'):
-            self.activate_session_patcher.stop()
-        if hasattr(self, 'read_config_patcher'):
-            self.read_config_patcher.stop()
 
 
     def configure_koji_responses(
@@ -192,18 +276,19 @@ class MulticallMocking:
         Configure what koji API calls should return.
 
         Args:
-            client_responses: Dict mapping method names to return values for ClientSession calls
+            client_responses: Sequence of (method name, response) pairs, queued
+              in order for ClientSession calls
             config_responses: Dict mapping profile names to config dicts for koji.read_config
 
         Example:
             self.configure_koji_responses(
-                client_responses=['getTag', {'name': 'test-tag', 'arches': 'x86_64'}}],
+                client_responses=[('getTag', {'name': 'test-tag', 'arches': 'x86_64'})],
                 config_responses={'koji': {'server': 'http://test-koji.example.com'}}
             )
         """
 
         for resp in client_responses:
-            self.client_responses.setdefault(resp[0], []).append(resp[1])
+            self.client_responses.setdefault(resp[0], deque()).append(resp[1])
 
         if config_responses:
             def config_side_effect(profile_name, *args, **kwargs):
@@ -215,7 +300,7 @@ class MulticallMocking:
         """
         Queue up a response for a specific method in the next multicall execution.
         """
-        self.client_responses.setdefault(method_name, []).append(response)
+        self.client_responses.setdefault(method_name, deque()).append(response)
 
 
     queue_multicall_response = queue_client_response
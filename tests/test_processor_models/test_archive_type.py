@@ -12,19 +12,9 @@ from unittest import TestCase
 from unittest.mock import Mock
 
 from koji_habitude.models import ArchiveType
-from koji_habitude.processor import (
-    CompareOnlyProcessor,
-    Processor,
-    ProcessorState,
-    ProcessorSummary,
-)
+from koji_habitude.processor import ProcessorState, ProcessorSummary
 
-from . import (
-    MulticallMocking,
-    create_empty_resolver,
-    create_solver_with_objects,
-    create_test_koji_session,
-)
+from . import MulticallMocking, create_processor
 
 
 def create_test_archive_type(name: str, extensions: list = None,
@@ -51,185 +41,98 @@ def create_test_archive_type(name: str, extensions: list = None,
     )
 
 
-class TestProcessorArchiveTypeBehavior(MulticallMocking, TestCase):
-
-    def test_archive_type_creation_minimal(self):
-        """Test creating a new archive type with minimal fields."""
-        archive_type = create_test_archive_type('jar', extensions=['jar'])
-        solver = create_solver_with_objects([archive_type])
-        mock_session = create_test_koji_session()
-
-        get_archive_types_mock = Mock()
-        get_archive_types_mock.return_value = []  # Archive type doesn't exist
-
-        add_archive_type_mock = Mock()
-        add_archive_type_mock.return_value = None
-
-        self.queue_client_response('getArchiveTypes', get_archive_types_mock)
-        self.queue_client_response('addArchiveType', add_archive_type_mock)
-
-        processor = Processor(
-            koji_session=mock_session,
-            dataseries=solver,
-            resolver=create_empty_resolver(),
-            chunk_size=10
-        )
-
-        result = processor.step()
-        self.assertTrue(result)  # Should process 1 object
-        self.assertEqual(processor.state, ProcessorState.READY_CHUNK)
+# expected addArchiveType kwargs for the multi-object tests
+ADD_JAR = dict(
+    name='jar', description='', extensions='jar',
+    compression_type=None)
+ADD_WAR = dict(
+    name='war', description='Web Archive', extensions='war',
+    compression_type=None)
+ADD_TAR = dict(
+    name='tar', description='', extensions='tar',
+    compression_type='tar')
+ADD_CUSTOM = dict(
+    name='custom', description='Custom type', extensions='custom',
+    compression_type=None)
+
+
+# case name: (create_test_archive_type kwargs, expected addArchiveType kwargs)
+ARCHIVE_CREATION_CASES = {
+    'minimal': (
+        {'name': 'jar', 'extensions': ['jar']},
+        {'name': 'jar', 'description': '', 'extensions': {'jar'},
+         'compression_type': None}),
+    'with_description': (
+        {'name': 'war', 'extensions': ['war'],
+         'description': 'Web Application Archive'},
+        {'name': 'war', 'description': 'Web Application Archive',
+         'extensions': {'war'}, 'compression_type': None}),
+    'with_compression': (
+        {'name': 'tar', 'extensions': ['tar'], 'description': 'TAR archive',
+         'compression': 'tar'},
+        {'name': 'tar', 'description': 'TAR archive', 'extensions': {'tar'},
+         'compression_type': 'tar'}),
+    'multiple_extensions': (
+        {'name': 'tarball', 'extensions': ['tar.gz', 'tgz', 'tar.bz2'],
+         'compression': 'tar'},
+        {'name': 'tarball', 'description': '',
+         'extensions': {'tar.gz', 'tgz', 'tar.bz2'}, 'compression_type': 'tar'}),
+}
 
-        get_archive_types_mock.assert_called_once_with()
-        add_archive_type_mock.assert_called_once_with(
-            name='jar',
-            description='',
-            extensions='jar',
-            compression_type=None
-        )
-
-    def test_archive_type_creation_with_description(self):
-        """Test creating an archive type with description."""
-        archive_type = create_test_archive_type(
-            'war',
-            extensions=['war'],
-            description='Web Application Archive'
-        )
-        solver = create_solver_with_objects([archive_type])
-        mock_session = create_test_koji_session()
-
-        get_archive_types_mock = Mock()
-        get_archive_types_mock.return_value = []
-
-        add_archive_type_mock = Mock()
-        add_archive_type_mock.return_value = None
 
-        self.queue_client_response('getArchiveTypes', get_archive_types_mock)
-        self.queue_client_response('addArchiveType', add_archive_type_mock)
-
-        processor = Processor(
-            koji_session=mock_session,
-            dataseries=solver,
-            resolver=create_empty_resolver(),
-            chunk_size=10
-        )
-
-        result = processor.step()
-        self.assertTrue(result)
-        self.assertEqual(processor.state, ProcessorState.READY_CHUNK)
+class TestProcessorArchiveTypeBehavior(MulticallMocking, TestCase):
 
-        get_archive_types_mock.assert_called_once_with()
-        add_archive_type_mock.assert_called_once_with(
-            name='war',
-            description='Web Application Archive',
-            extensions='war',
-            compression_type=None
-        )
-
-    def test_archive_type_creation_with_compression(self):
-        """Test creating an archive type with compression."""
-        archive_type = create_test_archive_type(
-            'tar',
-            extensions=['tar'],
-            description='TAR archive',
-            compression='tar'
-        )
-        solver = create_solver_with_objects([archive_type])
-        mock_session = create_test_koji_session()
-
-        get_archive_types_mock = Mock()
-        get_archive_types_mock.return_value = []
-
-        add_archive_type_mock = Mock()
-        add_archive_type_mock.return_value = None
+    def test_archive_type_creation(self):
+        """Test creating new archive types from various fields."""
 
-        self.queue_client_response('getArchiveTypes', get_archive_types_mock)
-        self.queue_client_response('addArchiveType', add_archive_type_mock)
+        for case, (archive_kwargs, expected) in ARCHIVE_CREATION_CASES.items():
+            with self.subTest(case=case):
+                self.client_responses.clear()
+                archive_type = create_test_archive_type(**archive_kwargs)
 
-        processor = Processor(
-            koji_session=mock_session,
-            dataseries=solver,
-            resolver=create_empty_resolver(),
-            chunk_size=10
-        )
+                # Archive type doesn't exist
+                get_archive_types_mock = Mock(return_value=[])
 
-        result = processor.step()
-        self.assertTrue(result)
-        self.assertEqual(processor.state, ProcessorState.READY_CHUNK)
+                add_archive_type_mock = Mock(return_value=None)
 
-        get_archive_types_mock.assert_called_once_with()
-        add_archive_type_mock.assert_called_once_with(
-            name='tar',
-            description='TAR archive',
-            extensions='tar',
-            compression_type='tar'
-        )
-
-    def test_archive_type_creation_multiple_extensions(self):
-        """Test creating an archive type with multiple extensions."""
-        archive_type = create_test_archive_type(
-            'tarball',
-            extensions=['tar.gz', 'tgz', 'tar.bz2'],
-            compression='tar'
-        )
-        solver = create_solver_with_objects([archive_type])
-        mock_session = create_test_koji_session()
-
-        get_archive_types_mock = Mock()
-        get_archive_types_mock.return_value = []
-
-        add_archive_type_mock = Mock()
-        add_archive_type_mock.return_value = None
+                self.queue_client_response('getArchiveTypes', get_archive_types_mock)
+                self.queue_client_response('addArchiveType', add_archive_type_mock)
 
-        self.queue_client_response('getArchiveTypes', get_archive_types_mock)
-        self.queue_client_response('addArchiveType', add_archive_type_mock)
+                processor = create_processor([archive_type])
 
-        processor = Processor(
-            koji_session=mock_session,
-            dataseries=solver,
-            resolver=create_empty_resolver(),
-            chunk_size=10
-        )
+                result = processor.step()
+                self.assertTrue(result)  # Should process 1 object
+                self.assertEqual(processor.state, ProcessorState.READY_CHUNK)
 
-        result = processor.step()
-        self.assertTrue(result)
-        self.assertEqual(processor.state, ProcessorState.READY_CHUNK)
+                get_archive_types_mock.assert_called_once_with()
+                add_archive_type_mock.assert_called_once()
 
-        get_archive_types_mock.assert_called_once_with()
-        # Extensions should be space-separated
-        call_args = add_archive_type_mock.call_args
-        self.assertEqual(call_args[1]['name'], 'tarball')
-        # Check that extensions are space-separated (order may vary due to set)
-        extensions_str = call_args[1]['extensions']
-        extensions_list = extensions_str.split(' ')
-        self.assertEqual(len(extensions_list), 3)
-        self.assertIn('tar.gz', extensions_list)
-        self.assertIn('tgz', extensions_list)
-        self.assertIn('tar.bz2', extensions_list)
+                # Extensions are space-separated, and their order may vary
+                # due to set
+                call_kwargs = dict(add_archive_type_mock.call_args.kwargs)
+                extensions = call_kwargs.pop('extensions').split(' ')
+                self.assertEqual(len(extensions), len(expected['extensions']))
+                self.assertEqual(set(extensions), expected['extensions'])
+                self.assertEqual(
+                    call_kwargs,
+                    {k: v for k, v in expected.items() if k != 'extensions'})
 
     def test_archive_type_no_changes_needed(self):
         """Test archive type that already exists."""
         archive_type = create_test_archive_type('jar', extensions=['jar'])
-        solver = create_solver_with_objects([archive_type])
-        mock_session = create_test_koji_session()
 
         # Mock getArchiveTypes to return existing archive type
-        get_archive_types_mock = Mock()
-        get_archive_types_mock.return_value = [{
+        get_archive_types_mock = Mock(return_value=[{
             'id': 1,
             'name': 'jar',
             'description': '',
             'extensions': 'jar',
             'compression_type': None
-        }]
+        }])
 
         self.queue_client_response('getArchiveTypes', get_archive_types_mock)
 
-        processor = Processor(
-            koji_session=mock_session,
-            dataseries=solver,
-            resolver=create_empty_resolver(),
-            chunk_size=10
-        )
+        processor = create_processor([archive_type])
 
         result = processor.step()
         self.assertTrue(result)  # Should process 1 object
@@ -245,45 +148,28 @@ class TestProcessorArchiveTypeBehavior(MulticallMocking, TestCase):
             create_test_archive_type('war', extensions=['war'], description='Web Archive'),
             create_test_archive_type('tar', extensions=['tar'], compression='tar')
         ]
-        solver = create_solver_with_objects(archive_types)
-        mock_session = create_test_koji_session()
 
         # Mock getArchiveTypes calls to return empty (archive types don't exist)
-        get_types1_mock = Mock()
-        get_types1_mock.return_value = []
-
-        get_types2_mock = Mock()
-        get_types2_mock.return_value = []
-
-        get_types3_mock = Mock()
-        get_types3_mock.return_value = []
+        get_types1_mock = Mock(return_value=[])
+        get_types2_mock = Mock(return_value=[])
+        get_types3_mock = Mock(return_value=[])
 
         # Mock addArchiveType calls for creation
-        add_jar_mock = Mock()
-        add_jar_mock.return_value = None
-
-        add_war_mock = Mock()
-        add_war_mock.return_value = None
-
-        add_tar_mock = Mock()
-        add_tar_mock.return_value = None
+        add_jar_mock = Mock(return_value=None)
+        add_war_mock = Mock(return_value=None)
+        add_tar_mock = Mock(return_value=None)
 
         # Queue responses for all archive types
-        self.queue_client_response('getArchiveTypes', get_types1_mock)
-        self.queue_client_response('addArchiveType', add_jar_mock)
-
-        self.queue_client_response('getArchiveTypes', get_types2_mock)
-        self.queue_client_response('addArchiveType', add_war_mock)
+        self.configure_koji_responses(client_responses=[
+            ('getArchiveTypes', get_types1_mock),
+            ('addArchiveType', add_jar_mock),
+            ('getArchiveTypes', get_types2_mock),
+            ('addArchiveType', add_war_mock),
+            ('getArchiveTypes', get_types3_mock),
+            ('addArchiveType', add_tar_mock),
+        ])
 
-        self.queue_client_response('getArchiveTypes', get_types3_mock)
-        self.queue_client_response('addArchiveType', add_tar_mock)
-
-        processor = Processor(
-            koji_session=mock_session,
-            dataseries=solver,
-            resolver=create_empty_resolver(),
-            chunk_size=10
-        )
+        processor = create_processor(archive_types)
 
         summary = processor.run()
         self.assertIsInstance(summary, ProcessorSummary)
@@ -295,12 +181,9 @@ class TestProcessorArchiveTypeBehavior(MulticallMocking, TestCase):
         get_types1_mock.assert_called_once_with()
         get_types2_mock.assert_called_once_with()
         get_types3_mock.assert_called_once_with()
-        add_jar_mock.assert_called_once_with(
-            name='jar', description='', extensions='jar', compression_type=None)
-        add_war_mock.assert_called_once_with(
-            name='war', description='Web Archive', extensions='war', compression_type=None)
-        add_tar_mock.assert_called_once_with(
-            name='tar', description='', extensions='tar', compression_type='tar')
+        add_jar_mock.assert_called_once_with(**ADD_JAR)
+        add_war_mock.assert_called_once_with(**ADD_WAR)
+        add_tar_mock.assert_called_once_with(**ADD_TAR)
 
     def test_archive_type_mixed_new_and_existing(self):
         """Test processing a mix of new and existing archive types."""
@@ -308,36 +191,27 @@ class TestProcessorArchiveTypeBehavior(MulticallMocking, TestCase):
             create_test_archive_type('jar', extensions=['jar']),  # Already exists
             create_test_archive_type('custom', extensions=['custom'], description='Custom type'),  # New
         ]
-        solver = create_solver_with_objects(archive_types)
-        mock_session = create_test_koji_session()
 
         # Mock jar as existing
-        get_jar_mock = Mock()
-        get_jar_mock.return_value = [{
+        get_jar_mock = Mock(return_value=[{
             'id': 1,
             'name': 'jar',
             'description': '',
             'extensions': 'jar'
-        }]
+        }])
 
         # Mock custom as not existing
-        get_custom_mock = Mock()
-        get_custom_mock.return_value = []
-
-        add_custom_mock = Mock()
-        add_custom_mock.return_value = None
+        get_custom_mock = Mock(return_value=[])
+        add_custom_mock = Mock(return_value=None)
 
         # Queue responses
-        self.queue_client_response('getArchiveTypes', get_jar_mock)
-        self.queue_client_response('getArchiveTypes', get_custom_mock)
-        self.queue_client_response('addArchiveType', add_custom_mock)
+        self.configure_koji_responses(client_responses=[
+            ('getArchiveTypes', get_jar_mock),
+            ('getArchiveTypes', get_custom_mock),
+            ('addArchiveType', add_custom_mock),
+        ])
 
-        processor = Processor(
-            koji_session=mock_session,
-            dataseries=solver,
-            resolver=create_empty_resolver(),
-            chunk_size=10
-        )
+        processor = create_processor(archive_types)
 
         summary = processor.run()
         self.assertIsInstance(summary, ProcessorSummary)
@@ -350,8 +224,7 @@ class TestProcessorArchiveTypeBehavior(MulticallMocking, TestCase):
 
         # Verify custom was created
         get_custom_mock.assert_called_once_with()
-        add_custom_mock.assert_called_once_with(
-            name='custom', description='Custom type', extensions='custom', compression_type=None)
+        add_custom_mock.assert_called_once_with(**ADD_CUSTOM)
 
 
 # The end.
@@ -12,19 +12,9 @@ from unittest import TestCase
 from unittest.mock import Mock
 
 from koji_habitude.models import BuildType
-from koji_habitude.processor import (
-    CompareOnlyProcessor,
-    Processor,
-    ProcessorState,
-    ProcessorSummary,
-)
+from koji_habitude.processor import ProcessorState, ProcessorSummary
 
-from . import (
-    MulticallMocking,
-    create_empty_resolver,
-    create_solver_with_objects,
-    create_test_koji_session,
-)
+from . import MulticallMocking, create_processor
 
 
 def create_test_build_type(name: str) -> BuildType:
@@ -44,62 +34,41 @@ def create_test_build_type(name: str) -> BuildType:
     )
 
 
-class TestProcessorBuildTypeBehavior(MulticallMocking, TestCase):
-
-    def test_build_type_creation(self):
-        """Test creating a new build type."""
-        build_type = create_test_build_type('rpm')
-        solver = create_solver_with_objects([build_type])
-        mock_session = create_test_koji_session()
-
-        list_btypes_mock = Mock()
-        list_btypes_mock.return_value = []  # Build type doesn't exist
-
-        add_btype_mock = Mock()
-        add_btype_mock.return_value = None
+# case name: (build type name, existing listBTypes rows, expect addBType)
+BUILD_TYPE_CASES = {
+    'creation': ('rpm', [], True),
+    'no_changes_needed': ('maven', [{'id': 1, 'name': 'maven'}], False),
+}
 
-        self.queue_client_response('listBTypes', list_btypes_mock)
-        self.queue_client_response('addBType', add_btype_mock)
 
-        processor = Processor(
-            koji_session=mock_session,
-            dataseries=solver,
-            resolver=create_empty_resolver(),
-            chunk_size=10
-        )
-
-        result = processor.step()
-        self.assertTrue(result)  # Should process 1 object
-        self.assertEqual(processor.state, ProcessorState.READY_CHUNK)
+class TestProcessorBuildTypeBehavior(MulticallMocking, TestCase):
 
-        list_btypes_mock.assert_called_once_with(query={'name': 'rpm'})
-        add_btype_mock.assert_called_once_with('rpm')
+    def test_build_type_single(self):
+        """Test processing a single build type, new or already existing."""
 
-    def test_build_type_no_changes_needed(self):
-        """Test build type that already exists."""
-        build_type = create_test_build_type('maven')
-        solver = create_solver_with_objects([build_type])
-        mock_session = create_test_koji_session()
+        for case, (name, existing, expect_add) in BUILD_TYPE_CASES.items():
+            with self.subTest(case=case):
+                self.client_responses.clear()
+                build_type = create_test_build_type(name)
 
-        # Mock listBTypes to return existing build type
-        list_btypes_mock = Mock()
-        list_btypes_mock.return_value = [{'id': 1, 'name': 'maven'}]
+                list_btypes_mock = Mock(return_value=existing)
+                add_btype_mock = Mock(return_value=None)
 
-        self.queue_client_response('listBTypes', list_btypes_mock)
+                self.queue_client_response('listBTypes', list_btypes_mock)
+                if expect_add:
+                    self.queue_client_response('addBType', add_btype_mock)
 
-        processor = Processor(
-            koji_session=mock_session,
-            dataseries=solver,
-            resolver=create_empty_resolver(),
-            chunk_size=10
-        )
+                processor = create_processor([build_type])
 
-        result = processor.step()
-        self.assertTrue(result)  # Should process 1 object
-        self.assertEqual(processor.state, ProcessorState.READY_CHUNK)
+                result = processor.step()
+                self.assertTrue(result)  # Should process 1 object
+                self.assertEqual(processor.state, ProcessorState.READY_CHUNK)
 
-        list_btypes_mock.assert_called_once_with(query={'name': 'maven'})
-        # Should not call addBType
+                list_btypes_mock.assert_called_once_with(query={'name': name})
+                if expect_add:
+                    add_btype_mock.assert_called_once_with(name)
+                else:
+                    add_btype_mock.assert_not_called()
 
     def test_processor_summary_with_multiple_build_types(self):
         """Test that the processor summary is correct with multiple build types."""
@@ -108,45 +77,28 @@ class TestProcessorBuildTypeBehavior(MulticallMocking, TestCase):
             create_test_build_type('maven'),
             create_test_build_type('image')
         ]
-        solver = create_solver_with_objects(build_types)
-        mock_session = create_test_koji_session()
 
         # Mock listBTypes calls to return empty (build types don't exist)
-        list_rpm_mock = Mock()
-        list_rpm_mock.return_value = []
-
-        list_maven_mock = Mock()
-        list_maven_mock.return_value = []
-
-        list_image_mock = Mock()
-        list_image_mock.return_value = []
+        list_rpm_mock = Mock(return_value=[])
+        list_maven_mock = Mock(return_value=[])
+        list_image_mock = Mock(return_value=[])
 
         # Mock addBType calls for creation
-        add_rpm_mock = Mock()
-        add_rpm_mock.return_value = None
-
-        add_maven_mock = Mock()
-        add_maven_mock.return_value = None
-
-        add_image_mock = Mock()
-        add_image_mock.return_value = None
+        add_rpm_mock = Mock(return_value=None)
+        add_maven_mock = Mock(return_value=None)
+        add_image_mock = Mock(return_value=None)
 
         # Queue responses for all build types
-        self.queue_client_response('listBTypes', list_rpm_mock)
-        self.queue_client_response('addBType', add_rpm_mock)
-
-        self.queue_client_response('listBTypes', list_maven_mock)
-        self.queue_client_response('addBType', add_maven_mock)
+        self.configure_koji_responses(client_responses=[
+            ('listBTypes', list_rpm_mock),
+            ('addBType', add_rpm_mock),
+            ('listBTypes', list_maven_mock),
+            ('addBType', add_maven_mock),
+            ('listBTypes', list_image_mock),
+            ('addBType', add_image_mock),
+        ])
 
-        self.queue_client_response('listBTypes', list_image_mock)
-        self.queue_client_response('addBType', add_image_mock)
-
-        processor = Processor(
-            koji_session=mock_session,
-            dataseries=solver,
-            resolver=create_empty_resolver(),
-            chunk_size=10
-        )
+        processor = create_processor(build_types)
 
         summary = processor.run()
         self.assertIsInstance(summary, ProcessorSummary)
@@ -168,31 +120,22 @@ class TestProcessorBuildTypeBehavior(MulticallMocking, TestCase):
             create_test_build_type('rpm'),  # Already exists
             create_test_build_type('win'),  # New
         ]
-        solver = create_solver_with_objects(build_types)
-        mock_session = create_test_koji_session()
 
         # Mock rpm as existing
-        list_rpm_mock = Mock()
-        list_rpm_mock.return_value = [{'id': 1, 'name': 'rpm'}]
+        list_rpm_mock = Mock(return_value=[{'id': 1, 'name': 'rpm'}])
 
         # Mock win as not existing
-        list_win_mock = Mock()
-        list_win_mock.return_value = []
-
-        add_win_mock = Mock()
-        add_win_mock.return_value = None
+        list_win_mock = Mock(return_value=[])
+        add_win_mock = Mock(return_value=None)
 
         # Queue responses
-        self.queue_client_response('listBTypes', list_rpm_mock)
-        self.queue_client_response('listBTypes', list_win_mock)
-        self.queue_client_response('addBType', add_win_mock)
-
-        processor = Processor(
-            koji_session=mock_session,
-            dataseries=solver,
-            resolver=create_empty_resolver(),
-            chunk_size=10
-        )
+        self.configure_koji_responses(client_responses=[
+            ('listBTypes', list_rpm_mock),
+            ('listBTypes', list_win_mock),
+            ('addBType', add_win_mock),
+        ])
+
+        processor = create_processor(build_types)
 
         summary = processor.run()
         self.assertIsInstance(summary, ProcessorSummary)
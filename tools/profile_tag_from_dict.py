@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+"""
+koji-habitude - Tag.from_dict Profiling
+
+Standalone utility to time Tag.from_dict on a tag using every field, to
+catch regressions in the simplified-format conversions (strings into
+inheritance and external repo links, group and package normalization).
+
+Author: Christopher O'Brien <obriencj@gmail.com>
+License: GNU General Public License v3
+"""
+
+
+import time
+from typing import Any, Dict, List
+
+import click
+
+from koji_habitude.models import Tag
+
+
+def build_tag_data(count: int) -> Dict[str, Any]:
+    """
+    Create the data for a tag using all fields, with `count` entries in
+    each of its inheritance, external-repos, groups, and packages lists.
+    Half of each list is in the simplified string format, so that both
+    conversion paths are exercised.
+
+    :param count: Number of entries in each list field
+    :returns: The tag data, suitable for Tag.from_dict
+    """
+
+    half = count // 2
+
+    return {
+        'type': 'tag',
+        'name': 'profile-tag',
+        'arches': ['x86_64', 'aarch64'],
+        'maven-support': True,
+        'maven-include-all': True,
+        'extras': {f'key{i}': f'value{i}' for i in range(count)},
+        'inheritance': (
+            [f'parent{i}' for i in range(half)] +
+            [{'name': f'parent{i}', 'priority': 100 + i * 10}
+             for i in range(half, count)]),
+        'external-repos': (
+            [f'repo{i}' for i in range(half)] +
+            [{'name': f'repo{i}', 'priority': 100 + i * 10,
+              'merge-mode': 'simple'}
+             for i in range(half, count)]),
+        'groups': {
+            f'group{i}': (
+                [f'pkg{j}' for j in range(half)] +
+                [f'@group{j}' for j in range(half, count)])
+            for i in range(count)
+        },
+        'packages': (
+            [f'package{i}' for i in range(half)] +
+            [{'name': f'package{i}', 'owner': 'user',
+              'extra-arches': ['noarch']}
+             for i in range(half, count)]),
+    }
+
+
+def profile_from_dict(data: Dict[str, Any], rounds: int) -> float:
+    """
+    Time `rounds` calls of Tag.from_dict on data
+
+    :param data: The tag data
+    :param rounds: Number of calls to time
+    :returns: Total elapsed time in seconds
+    """
+
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        Tag.from_dict(data)
+    return time.perf_counter() - start_time
+
+
+@click.command()
+@click.option(
+    '--count', '-c',
+    default=10,
+    type=click.IntRange(min=0),
+    help="Entries in each list field of the tag (default: 10)")
+@click.option(
+    '--warmup', '-w',
+    default=5,
+    type=click.IntRange(min=0),
+    help="Untimed calls made before measuring (default: 5)")
+@click.option(
+    '--rounds', '-r',
+    default=100,
+    type=click.IntRange(min=1),
+    help="Calls timed per iteration (default: 100)")
+@click.option(
+    '--iterations', '-n',
+    default=5,
+    type=click.IntRange(min=1),
+    help="Number of timed iterations (default: 5)")
+def main(
+        count: int,
+        warmup: int,
+        rounds: int,
+        iterations: int):
+    """
+    Profile the time taken by Tag.from_dict.
+
+    A fixed tag is converted repeatedly, after some warm-up calls so that
+    one-time costs (such as building pydantic validators) are not
+    included in the measurements.
+    """
+
+    data = build_tag_data(count)
+
+    click.echo(f"Profiling Tag.from_dict with {count} entries per field")
+    click.echo(f"Warm-up calls: {warmup}")
+    click.echo(f"Rounds: {rounds}")
+    click.echo(f"Iterations: {iterations}")
+    click.echo()
+
+    profile_from_dict(data, warmup)
+
+    results: List[float] = []
+    for i in range(iterations):
+        click.echo(f"Iteration {i + 1}/{iterations}...", nl=False)
+        elapsed = profile_from_dict(data, rounds)
+        results.append(elapsed)
+        click.echo(f" done ({elapsed:.3f}s)")
+
+    per_call = [elapsed / rounds * 1e6 for elapsed in results]
+
+    click.echo()
+    click.echo("Results (microseconds per call):")
+    click.echo("-" * 60)
+    click.echo(f"{'Min':<15} {'Max':<15} {'Avg':<15}")
+    click.echo("-" * 60)
+    click.echo(
+        f"{min(per_call):<15.1f} {max(per_call):<15.1f} "
+        f"{sum(per_call) / len(per_call):<15.1f}")
+    click.echo("-" * 60)
+
+
+if __name__ == '__main__':
+    main()
+
+
+# The end.